@@ -1,16 +1,294 @@
-from fastapi import FastAPI
-from extractor import extract_skills
+import asyncio
+import io
+import os
+import threading
+import time
+from contextlib import asynccontextmanager
 
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import JSONResponse, PlainTextResponse
 
-app = FastAPI()
+from skillgap import extractor, metrics
+from skillgap.jobs import JobQueue, JobTooLarge, QueueFull
+from skillgap.model_server import MODEL_SERVER, ModelClient, result_version, run_batch, taxonomy_info
+from skillgap.result_cache import ResultCache, cache_key
+from skillgap.scheduler import BatchScheduler
+
+# Extraction results keyed by document content; set SKILLGAP_CACHE_PATH to persist
+result_cache = ResultCache(
+    max_entries=int(os.environ.get("SKILLGAP_CACHE_SIZE", "4096")),
+    ttl=float(os.environ["SKILLGAP_CACHE_TTL"]) if os.environ.get("SKILLGAP_CACHE_TTL") else None,
+    path=os.environ.get("SKILLGAP_CACHE_PATH"),
+)
+
+# Set SKILLGAP_SERVER_TIMING=1 to report per-stage timings in a Server-Timing header
+SERVER_TIMING = os.environ.get("SKILLGAP_SERVER_TIMING", "") not in ("", "0", "false")
+
+REQUESTS = metrics.REGISTRY.counter("skillgap_requests_total", "HTTP requests", ("endpoint", "status"))
+ERRORS = metrics.REGISTRY.counter("skillgap_errors_total", "HTTP requests that failed", ("endpoint",))
+REQUEST_SECONDS = metrics.REGISTRY.histogram("skillgap_request_seconds", "HTTP request latency", ("endpoint",))
+
+
+# With SKILLGAP_MODEL_SERVER set, models live in one shared host process
+# (python -m skillgap.model_server) instead of in every API worker
+model_client = ModelClient(MODEL_SERVER) if MODEL_SERVER else None
+
+# All model calls go through one worker that groups concurrent documents into batches
+scheduler = BatchScheduler(
+    model_client.run_batch if model_client else run_batch,
+    max_batch_size=int(os.environ.get("SKILLGAP_MAX_BATCH_SIZE", "16")),
+    max_wait_ms=float(os.environ.get("SKILLGAP_MAX_WAIT_MS", "10")),
+)
+
+
+def _process_job(text):
+    # Runs on a job worker thread; shares the result cache and the batch scheduler
+    key = cache_key(text, current_result_version())
+    result = result_cache.get(key)
+    if result is None:
+        result, _ = scheduler.submit((text, None)).result()
+        if not result.get("budget_exhausted"):
+            result_cache.set(key, result)
+    return result
+
+
+# Uploaded documents are spooled to SKILLGAP_JOB_DIR and processed in the background
+jobs = JobQueue(
+    _process_job,
+    spool_dir=os.environ.get("SKILLGAP_JOB_DIR"),
+    workers=int(os.environ.get("SKILLGAP_JOB_WORKERS", "2")),
+    max_queued=int(os.environ.get("SKILLGAP_JOB_QUEUE_SIZE", "32")),
+    ttl=float(os.environ.get("SKILLGAP_JOB_TTL", "3600")),
+    max_bytes=int(os.environ.get("SKILLGAP_JOB_MAX_BYTES", str(20 * 1024 * 1024))),
+)
+JOB_FORMATS = (".pdf", ".docx", ".txt")
+
+for _name, _help, _key, _stats in (
+    ("skillgap_cache_hits", "Result cache hits", "hits", result_cache.stats),
+    ("skillgap_cache_misses", "Result cache misses", "misses", result_cache.stats),
+    ("skillgap_cache_evictions", "Result cache evictions", "evictions", result_cache.stats),
+    ("skillgap_cache_entries", "Result cache entries", "entries", result_cache.stats),
+    ("skillgap_scheduler_queued", "Documents waiting for a batch", "queued", scheduler.stats),
+    ("skillgap_scheduler_batches", "Batches run by the scheduler", "batches", scheduler.stats),
+    ("skillgap_jobs_queued", "Jobs waiting for a worker", "queued", jobs.stats),
+    ("skillgap_jobs_running", "Jobs being processed", "running", jobs.stats),
+):
+    metrics.REGISTRY.gauge_callback(_name, _help, lambda k=_key, fn=_stats: fn()[k])
+
+# Set SKILLGAP_TAXONOMY_POLL to a number of seconds to reload the taxonomy when its file changes
+TAXONOMY_POLL = float(os.environ.get("SKILLGAP_TAXONOMY_POLL", "0"))
+
+warm_up_error = None
+
+
+def _warm_up():
+    global warm_up_error
+    try:
+        extractor.warm_up()
+    except Exception as e:
+        warm_up_error = repr(e)
+
+
+@asynccontextmanager
+async def lifespan(app):
+    stop_watching = threading.Event()
+    if model_client is None:
+        # Warm models in the background so /healthz answers while they load
+        threading.Thread(target=_warm_up, name="model-warm-up", daemon=True).start()
+        if TAXONOMY_POLL > 0:
+            threading.Thread(
+                target=extractor.watch_taxonomy, args=(TAXONOMY_POLL, stop_watching), name="taxonomy-watch", daemon=True
+            ).start()
+    scheduler.start()
+    jobs.start()
+    yield
+    stop_watching.set()
+    jobs.stop()
+    scheduler.stop()
+    if model_client is not None:
+        model_client.close()
+
+
+def current_result_version():
+    return model_client.version() if model_client else result_version()
+
+
+async def extract_cached(texts, timings=None, budget_ms=None):
+    """Result dict for each text, from the cache or from one scheduled batch of misses"""
+    start = time.perf_counter()
+    version = await asyncio.to_thread(current_result_version) if model_client else current_result_version()
+    keys = [cache_key(text, version) for text in texts]
+    # Off the event loop: with SKILLGAP_CACHE_PATH set, lookups hit SQLite
+    results = await asyncio.to_thread(result_cache.get_many, keys)
+    if timings is not None:
+        timings["cache"] = time.perf_counter() - start
+
+    todo = [i for i, result in enumerate(results) if result is None]
+    futures = scheduler.submit_many([(texts[i], budget_ms) for i in todo])
+    computed = await asyncio.gather(*(asyncio.wrap_future(f) for f in futures))
+    fresh = []
+    for i, (result, batch_timings) in zip(todo, computed):
+        results[i] = result
+        # A cascade result cut short by its budget is not the final answer; don't cache it
+        if not result.get("budget_exhausted"):
+            fresh.append((keys[i], result))
+        if timings is not None:
+            for name, seconds in batch_timings.items():
+                timings[name] = max(timings.get(name, 0.0), seconds)
+    if fresh:
+        await asyncio.to_thread(result_cache.set_many, fresh)
+
+    return results
+
+
+app = FastAPI(lifespan=lifespan)
+
+@app.middleware("http")
+async def record_metrics(request: Request, call_next):
+    request.state.timings = {}
+    start = time.perf_counter()
+    try:
+        response = await call_next(request)
+    except Exception:
+        endpoint = getattr(request.scope.get("route"), "path", "unmatched")
+        ERRORS.inc(endpoint=endpoint)
+        REQUESTS.inc(endpoint=endpoint, status="500")
+        raise
+    elapsed = time.perf_counter() - start
+
+    endpoint = getattr(request.scope.get("route"), "path", "unmatched")
+    REQUESTS.inc(endpoint=endpoint, status=str(response.status_code))
+    REQUEST_SECONDS.observe(elapsed, endpoint=endpoint)
+    if response.status_code >= 500:
+        ERRORS.inc(endpoint=endpoint)
+
+    if SERVER_TIMING:
+        timings = dict(request.state.timings, total=elapsed)
+        response.headers["Server-Timing"] = ", ".join(
+            f"{name};dur={seconds * 1000:.2f}" for name, seconds in timings.items()
+        )
+    return response
 
 @app.get("/")
 def home():
     return {"message": "Server running"}
 
+@app.get("/healthz")
+def healthz():
+    return {"status": "ok"}
+
+@app.get("/readyz")
+def readyz():
+    ready, error = extractor.is_ready(), warm_up_error
+    if model_client is not None:
+        try:
+            ready, error = model_client.ready()
+        except (OSError, EOFError, RuntimeError) as e:
+            return JSONResponse(status_code=503, content={"status": "model server unavailable", "error": repr(e)})
+    if ready:
+        return {"status": "ready"}
+    detail = {"status": "warming up"}
+    if error:
+        detail = {"status": "failed", "error": error}
+    return JSONResponse(status_code=503, content=detail)
+
+@app.get("/cache/stats")
+def cache_stats():
+    return result_cache.stats()
+
+@app.get("/scheduler/stats")
+def scheduler_stats():
+    return scheduler.stats()
+
+@app.get("/metrics")
+def prometheus_metrics():
+    return PlainTextResponse(metrics.REGISTRY.render(), media_type="text/plain; version=0.0.4")
+
+@app.get("/metrics/models")
+def model_server_metrics():
+    """Stage latencies recorded by the shared model host (empty when models run in-process)"""
+    text = model_client.metrics() if model_client else ""
+    return PlainTextResponse(text, media_type="text/plain; version=0.0.4")
+
+@app.get("/taxonomy")
+def get_taxonomy():
+    if model_client is not None:
+        return model_client.taxonomy()
+    return taxonomy_info(extractor.get_taxonomy())
+
+@app.post("/admin/taxonomy/reload")
+def reload_taxonomy_endpoint():
+    """Reload the configured skills file (SKILLGAP_SKILLS_PATH) and swap it in without a restart"""
+    if model_client is not None:
+        try:
+            return model_client.reload_taxonomy()
+        except RuntimeError as e:
+            raise HTTPException(status_code=400, detail=f"Could not load taxonomy: {e}")
+    try:
+        taxonomy = extractor.reload_taxonomy()
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        raise HTTPException(status_code=400, detail=f"Could not load taxonomy: {e}")
+    return taxonomy_info(taxonomy)
+
+def _budget_ms(data):
+    """Optional per-request "budget_ms" (cascade pipeline only); None means SKILLGAP_BUDGET_MS"""
+    budget_ms = data.get("budget_ms")
+    if budget_ms is not None and (isinstance(budget_ms, bool) or not isinstance(budget_ms, (int, float)) or budget_ms < 0):
+        raise HTTPException(status_code=422, detail="'budget_ms' must be a non-negative number")
+    return budget_ms
+
 @app.post("/extract")
-def extract(data: dict):
+async def extract(data: dict, request: Request):
     text = data["text"]
-    skills = extract_skills(text)
-    return {"skills": skills}
+    return (await extract_cached([text], request.state.timings, _budget_ms(data)))[0]
+
+@app.post("/extract/batch")
+async def extract_batch(data: dict, request: Request):
+    texts = data["texts"]
+    if not isinstance(texts, list) or not all(isinstance(t, str) for t in texts):
+        raise HTTPException(status_code=422, detail="'texts' must be a list of strings")
+    results = await extract_cached(texts, request.state.timings, _budget_ms(data))
+    return {"results": results}
+
+@app.post("/jobs", status_code=202)
+async def submit_job(request: Request):
+    """Queue a PDF/DOCX/TXT upload (multipart field "file") or {"text": ...} for extraction"""
+    try:
+        jobs.check_capacity()
+        if request.headers.get("content-type", "").startswith("multipart/form-data"):
+            form = await request.form()
+            upload = form.get("file")
+            if upload is None or isinstance(upload, str):
+                raise HTTPException(status_code=422, detail="multipart body needs a 'file' upload")
+            if not upload.filename.lower().endswith(JOB_FORMATS):
+                raise HTTPException(status_code=415, detail=f"Unsupported file format: {upload.filename}")
+            job_id = await asyncio.to_thread(jobs.submit, upload.file, upload.filename)
+        else:
+            try:
+                data = await request.json()
+            except ValueError:   # json.JSONDecodeError and undecodable bytes
+                raise HTTPException(status_code=422, detail="Body must be JSON or a multipart upload")
+            text = data.get("text") if isinstance(data, dict) else None
+            if not isinstance(text, str):
+                raise HTTPException(status_code=422, detail="'text' must be a string")
+            job_id = await asyncio.to_thread(jobs.submit, io.BytesIO(text.encode("utf-8")), "text.txt")
+    except QueueFull as e:
+        return JSONResponse(
+            status_code=429, content={"detail": str(e)}, headers={"Retry-After": str(e.retry_after)}
+        )
+    except JobTooLarge as e:
+        raise HTTPException(status_code=413, detail=str(e))
+    return {"id": job_id, "status": "queued", "url": f"/jobs/{job_id}"}
+
+@app.get("/jobs/stats")
+def job_stats():
+    return jobs.stats()
 
+@app.get("/jobs/{job_id}")
+async def get_job(job_id: str, wait: float = 0):
+    """Job status and, once done, its result; wait (up to 30 s) long-polls for completion"""
+    # Waits on the event loop: a long-poll must not hold an executor thread for up to 30 s
+    job = await jobs.wait(job_id, min(max(wait, 0), 30))
+    if job is None:
+        raise HTTPException(status_code=404, detail="Unknown or expired job")
+    return job
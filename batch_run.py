@@ -0,0 +1,277 @@
+# ----------------------------------------------------------
+# SkillGapAI - Resumable, sharded batch runs
+# ----------------------------------------------------------
+# Documents are assigned to a fixed number of shards by a hash of their
+# name. Each shard appends to its own output and manifest in the run
+# directory:
+#
+#   <run-dir>/run.json                 shard count for the run
+#   <run-dir>/shard-00007.jsonl        one record per document
+#   <run-dir>/shard-00007.manifest     content hashes of finished documents
+#   <run-dir>/shard-00007.done         written once the whole shard is finished
+#
+# Document names are listed first (no reads) and the shards are then
+# processed one at a time, each marked done as soon as it finishes.
+# Re-running the same command resumes: finished shards are skipped by
+# their marker, and only the shard that was interrupted re-reads its
+# documents and skips those in its manifest, so restart cost is
+# O(shards). Documents that failed are written with their error but left
+# out of the manifest, and their shard is not marked done, so the next run
+# retries them. Machines sharing the run directory split the shards with
+# --worker/--num-workers:
+#
+#   python batch_run.py resumes/ --run-dir runs/backfill --shards 256 --worker 0 --num-workers 4
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import tarfile
+import time
+import zipfile
+from collections import defaultdict
+
+from ingest import SUPPORTED_EXTENSIONS, add_skills, parse_all
+
+
+def shard_of(doc_id, n_shards):
+    """Deterministic shard for a document name, stable across runs and machines"""
+    return int(hashlib.sha1(doc_id.encode("utf-8")).hexdigest()[:8], 16) % n_shards
+
+
+def _supported(name):
+    return name.lower().endswith(SUPPORTED_EXTENSIONS)
+
+
+class DocumentReader:
+    """Lists document names without reading them, then reads documents by name.
+
+    Archives stay open for the whole run. Compressed tar archives are read
+    with random access, which is slow; prefer a directory or a zip for
+    large runs.
+    """
+
+    def __init__(self):
+        self._archives = {}
+
+    def _archive(self, source):
+        if source not in self._archives:
+            if zipfile.is_zipfile(source):
+                self._archives[source] = zipfile.ZipFile(source)
+            else:
+                self._archives[source] = tarfile.open(source)
+        return self._archives[source]
+
+    def names(self, source):
+        if os.path.isdir(source):
+            for root, dirs, files in os.walk(source):
+                dirs.sort()
+                for file_name in sorted(files):
+                    if _supported(file_name):
+                        yield os.path.relpath(os.path.join(root, file_name), source)
+
+        elif zipfile.is_zipfile(source):
+            for member in self._archive(source).infolist():
+                if not member.is_dir() and _supported(member.filename):
+                    yield member.filename
+
+        elif tarfile.is_tarfile(source):
+            for member in self._archive(source).getmembers():
+                if member.isfile() and _supported(member.name):
+                    yield member.name
+
+        elif _supported(source):
+            yield os.path.basename(source)
+
+        else:
+            raise ValueError(f"Not a directory, archive or supported document: {source}")
+
+    def read(self, source, name):
+        if os.path.isdir(source):
+            path = os.path.join(source, name)
+        elif source in self._archives:
+            archive = self._archives[source]
+            if isinstance(archive, zipfile.ZipFile):
+                return archive.read(name)
+            return archive.extractfile(name).read()
+        else:
+            path = source
+        with open(path, "rb") as f:
+            return f.read()
+
+    def close(self):
+        for archive in self._archives.values():
+            archive.close()
+        self._archives = {}
+
+
+class ShardSet:
+    """Outputs, manifests and done markers for the shards this worker owns."""
+
+    def __init__(self, run_dir, n_shards, shards):
+        self.run_dir = run_dir
+        self.n_shards = n_shards
+        self.pending = [s for s in shards if not os.path.exists(self._path(s, "done"))]
+        self._finished = {}
+        self._failed = set()
+        self._outputs = {}
+        self._manifests = {}
+
+    def _path(self, shard, suffix):
+        return os.path.join(self.run_dir, f"shard-{shard:05d}.{suffix}")
+
+    def finished(self, shard):
+        """Content hashes already completed in a shard (manifest loaded once)"""
+        if shard not in self._finished:
+            hashes = set()
+            manifest = self._path(shard, "manifest")
+            if os.path.exists(manifest):
+                with open(manifest, "r") as f:
+                    hashes.update(line.strip() for line in f if line.strip())
+            self._finished[shard] = hashes
+        return self._finished[shard]
+
+    def write(self, shard, digest, record):
+        if shard not in self._outputs:
+            self._outputs[shard] = open(self._path(shard, "jsonl"), "a", encoding="utf-8")
+            self._manifests[shard] = open(self._path(shard, "manifest"), "a")
+
+        # Output before manifest: a crash can duplicate a record, never lose one
+        output = self._outputs[shard]
+        output.write(json.dumps(record, ensure_ascii=False) + "\n")
+        output.flush()
+        if record["error"]:
+            self._failed.add(shard)   # not in the manifest, so a resumed run retries it
+            return
+        manifest = self._manifests[shard]
+        manifest.write(digest + "\n")
+        manifest.flush()
+        self.finished(shard).add(digest)
+
+    def mark_done(self, shard):
+        """Close a finished shard's files and write its marker, unless a document failed"""
+        for files in (self._outputs, self._manifests):
+            if shard in files:
+                files.pop(shard).close()
+        if shard not in self._failed:
+            with open(self._path(shard, "done"), "w") as f:
+                f.write(f"{len(self.finished(shard))}\n")
+        self._finished.pop(shard, None)
+
+    def close(self):
+        for f in list(self._outputs.values()) + list(self._manifests.values()):
+            f.close()
+
+
+def _load_run(run_dir, n_shards):
+    os.makedirs(run_dir, exist_ok=True)
+    run_file = os.path.join(run_dir, "run.json")
+    if os.path.exists(run_file):
+        with open(run_file, "r") as f:
+            stored = json.load(f)["shards"]
+        if n_shards is not None and n_shards != stored:
+            raise ValueError(f"{run_dir} was started with {stored} shards, not {n_shards}")
+        return stored
+    if n_shards is None:
+        raise ValueError("--shards is required for a new run")
+    with open(run_file, "w") as f:
+        json.dump({"shards": n_shards}, f)
+    return n_shards
+
+
+def run(sources, run_dir, n_shards=None, worker=0, num_workers=1,
+        workers=None, with_skills=True, batch_size=32, progress_every=100):
+    n_shards = _load_run(run_dir, n_shards)
+    owned = [s for s in range(n_shards) if s % num_workers == worker]
+    shard_set = ShardSet(run_dir, n_shards, owned)
+    pending = set(shard_set.pending)
+    reader = DocumentReader()
+    skipped = 0
+
+    def todo(shard, documents, pending_docs):
+        nonlocal skipped
+        for doc_id, source, name in documents:
+            data = reader.read(source, name)
+            digest = hashlib.sha256(data).hexdigest()
+            if digest in shard_set.finished(shard) or doc_id in pending_docs:
+                skipped += 1
+                continue
+            pending_docs[doc_id] = digest
+            yield doc_id, None, data
+
+    start = time.perf_counter()
+    processed = failed = 0
+    try:
+        # Names only: cheap, and lets each shard be finished (and marked) on its own
+        by_shard = defaultdict(list)
+        for source in sources:
+            for name in reader.names(source):
+                doc_id = name if len(sources) == 1 else f"{source}/{name}"
+                shard = shard_of(doc_id, n_shards)
+                if shard in pending:
+                    by_shard[shard].append((doc_id, source, name))
+
+        for shard in shard_set.pending:
+            pending_docs = {}
+            records = parse_all(todo(shard, by_shard.pop(shard, []), pending_docs), workers or os.cpu_count() or 1)
+            if with_skills:
+                records = add_skills(records, batch_size)
+            for record in records:
+                digest = pending_docs.pop(record["path"])
+                record["sha256"] = digest
+                record["chars"] = len(record.pop("text"))
+                shard_set.write(shard, digest, record)
+                processed += 1
+                failed += bool(record["error"])
+                if progress_every and processed % progress_every == 0:
+                    elapsed = time.perf_counter() - start
+                    print(f"{processed} files, {skipped} skipped, {failed} errors, "
+                          f"{processed / elapsed:.1f} files/s", file=sys.stderr)
+            shard_set.mark_done(shard)
+    finally:
+        shard_set.close()
+        reader.close()
+
+    elapsed = time.perf_counter() - start
+    return {
+        "shards": len(owned),
+        "shards_already_done": len(owned) - len(pending),
+        "files": processed,
+        "skipped": skipped,
+        "errors": failed,
+        "seconds": round(elapsed, 3),
+        "files_per_second": round(processed / elapsed, 2) if elapsed else 0.0,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Resumable, sharded skill-extraction run")
+    parser.add_argument("sources", nargs="+", help="directories, .zip/.tar archives or files")
+    parser.add_argument("--run-dir", required=True)
+    parser.add_argument("--shards", type=int, default=None, help="shard count (fixed when the run starts)")
+    parser.add_argument("--worker", type=int, default=0, help="this machine's index")
+    parser.add_argument("--num-workers", type=int, default=1, help="machines sharing the run directory")
+    parser.add_argument("--workers", type=int, default=None, help="parser processes (default: CPU count)")
+    parser.add_argument("--batch-size", type=int, default=32)
+    parser.add_argument("--no-skills", action="store_true")
+    args = parser.parse_args()
+
+    if not 0 <= args.worker < args.num_workers:
+        parser.error("--worker must be in [0, --num-workers)")
+
+    summary = run(
+        args.sources,
+        args.run_dir,
+        n_shards=args.shards,
+        worker=args.worker,
+        num_workers=args.num_workers,
+        workers=args.workers,
+        with_skills=not args.no_skills,
+        batch_size=args.batch_size,
+    )
+    print(json.dumps(summary), file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,5 @@
+"""Offline benchmarks for the SkillGapAI pipeline stages.
+
+Run ``python -m benchmarks.run`` for the stage suite and
+``python -m benchmarks.ann`` for ANN vs exact taxonomy search.
+"""
@@ -0,0 +1,88 @@
+# ----------------------------------------------------------
+# SkillGapAI - ANN index vs exact search benchmark
+# ----------------------------------------------------------
+# Synthetic taxonomy (clustered unit vectors, MiniLM-sized):
+#
+#   python -m benchmarks.ann --size 100000 --nprobe 4 8 16 32
+#
+# Or a real taxonomy from the embedding store:
+#
+#   python -m benchmarks.ann --store .embeddings
+
+import argparse
+import json
+import time
+
+import numpy as np
+
+from skillgap.ann_index import IVFIndex
+from skillgap.embedding_store import EmbeddingStore
+from skillgap.similarity import top_k_similar
+
+
+def synthetic_taxonomy(size, dim=384, n_topics=500, seed=0):
+    rng = np.random.default_rng(seed)
+    topics = rng.normal(size=(n_topics, dim))
+    vectors = topics[rng.integers(n_topics, size=size)] + 0.6 * rng.normal(size=(size, dim))
+    return vectors.astype(np.float32), [f"skill-{i}" for i in range(size)]
+
+
+def run(vectors, labels, n_queries, k, nprobes, seed=0):
+    rng = np.random.default_rng(seed + 1)
+    # Queries are perturbed taxonomy entries, like a typo'd or reworded skill
+    picks = rng.choice(len(vectors), n_queries, replace=False)
+    queries = vectors[picks] + 0.3 * rng.normal(size=(n_queries, vectors.shape[1])).astype(np.float32)
+
+    start = time.perf_counter()
+    index = IVFIndex.build(vectors, labels)
+    build_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    exact = top_k_similar(queries, vectors, k=k)[1]
+    exact_ms = (time.perf_counter() - start) * 1000 / n_queries
+
+    report = {
+        "taxonomy_size": len(vectors),
+        "queries": n_queries,
+        "k": k,
+        "n_lists": index.n_lists,
+        "build_seconds": round(build_s, 3),
+        "exact_ms_per_query": round(exact_ms, 4),
+        "ann": [],
+    }
+    for nprobe in nprobes:
+        start = time.perf_counter()
+        approx = index.search(queries, k=k, nprobe=nprobe)[1]
+        ann_ms = (time.perf_counter() - start) * 1000 / n_queries
+        recall = np.mean([len(set(a) & set(e)) / k for a, e in zip(approx, exact)])
+        report["ann"].append({
+            "nprobe": nprobe,
+            "recall_at_k": round(float(recall), 4),
+            "ms_per_query": round(ann_ms, 4),
+            "speedup": round(exact_ms / ann_ms, 2) if ann_ms else None,
+        })
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ANN vs exact skill search benchmark")
+    parser.add_argument("--size", type=int, default=100000, help="synthetic taxonomy size")
+    parser.add_argument("--store", help="embedding store directory to benchmark instead")
+    parser.add_argument("--model", default="all-MiniLM-L6-v2", help="model name inside --store")
+    parser.add_argument("--queries", type=int, default=500)
+    parser.add_argument("--k", type=int, default=5)
+    parser.add_argument("--nprobe", type=int, nargs="+", default=[1, 4, 8, 16, 32])
+    args = parser.parse_args()
+
+    if args.store:
+        store = EmbeddingStore(args.store, args.model)
+        vectors, labels = np.asarray(store.vectors(), dtype=np.float32), store.skills()
+    else:
+        vectors, labels = synthetic_taxonomy(args.size)
+
+    n_queries = min(args.queries, len(vectors))
+    print(json.dumps(run(vectors, labels, n_queries, args.k, args.nprobe), indent=2))
+
+
+if __name__ == "__main__":
+    main()
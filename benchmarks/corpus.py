@@ -0,0 +1,52 @@
+import random
+
+from skillgap.text import normalize_skill
+
+FILLER = (
+    "experience team project data build design deliver worked with using "
+    "customers product developed led improved analysis reports systems the "
+    "and of to in for on a an our their strong knowledge across multiple"
+).split()
+
+SYLLABLES = "ka lo mi ne tru vex pla dor sin qua ber zu fen gat hol jib".split()
+
+
+def synthetic_taxonomy(size, seed=0, base=None):
+    """Reproducible ``{category: [skill, ...]}`` with ``size`` distinct skills"""
+    rng = random.Random(seed)
+    skills = {"technical": [], "soft": []}
+    seen = set()
+    for category, skill_list in (base or {}).items():
+        for skill in skill_list:
+            if len(seen) < size and normalize_skill(skill) not in seen:
+                seen.add(normalize_skill(skill))
+                skills.setdefault(category, []).append(skill)
+
+    while len(seen) < size:
+        n_words = rng.choice((1, 1, 2, 2, 3))
+        skill = " ".join(
+            "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 3)))
+            for _ in range(n_words)
+        )
+        if skill not in seen:
+            seen.add(skill)
+            skills["technical" if rng.random() < 0.8 else "soft"].append(skill)
+    return skills
+
+
+def synthetic_documents(taxonomy, count, words, skill_rate=0.05, seed=0):
+    """Reproducible documents of ``words`` words with taxonomy skills mixed in"""
+    rng = random.Random(seed)
+    all_skills = [skill for skill_list in taxonomy.values() for skill in skill_list]
+    documents = []
+    for _ in range(count):
+        out = []
+        while len(out) < words:
+            if rng.random() < skill_rate:
+                out.append(rng.choice(all_skills).title())
+            else:
+                out.append(rng.choice(FILLER))
+            if rng.random() < 0.08:
+                out[-1] += rng.choice((".", ",", "\n"))
+        documents.append(" ".join(out))
+    return documents
@@ -0,0 +1,96 @@
+# ----------------------------------------------------------
+# SkillGapAI - Page-by-page PDF text parity check
+# ----------------------------------------------------------
+# Runs parsing.extract_text over fake PDFs (a stand-in PdfReader with fixed
+# page texts) and compares it with the original whole-document path,
+# ``text += content + "\n"`` per page and then clean_text, cut to max_chars:
+#
+#   python -m benchmarks.pdf_parity
+#
+# Covers empty and whitespace-only pages, words and whitespace at page
+# boundaries, max_pages, and every max_chars cut. Exits non-zero on any mismatch.
+
+import io
+import sys
+from contextlib import contextmanager
+
+from skillgap import parsing
+from skillgap.text import clean_text
+
+DOCUMENTS = {
+    "plain": ["Python developer\nwith SQL", "Docker and\nKubernetes", "Led a team of five."],
+    "empty_pages": [None, "Python", "", None, "SQL and Spark", ""],
+    "whitespace_pages": ["  \n\t ", "Machine learning", "\n\n", "   ", "Deep learning  \r\n"],
+    "boundary_joins": ["skills: Pyth", "on, Ja", "va\n", "\nScala ", " Go", "-lang"],
+    "leading_trailing": ["\n  Summary  \n", "  Data engineer \n\n", "\t\tAWS\t"],
+    "all_blank": [None, "", "   ", "\n"],
+    "single_long": ["word " * 200],
+}
+
+
+class _Page:
+    def __init__(self, text):
+        self._text = text
+
+    def extract_text(self):
+        return self._text
+
+
+class _FakeReader:
+    pages = []
+
+    def __init__(self, source):
+        self.pages = [_Page(text) for text in type(self).pages]
+
+
+@contextmanager
+def fake_pdf(pages):
+    """Make parsing read the given page texts for any PDF source"""
+    reader = type("FakeReader", (_FakeReader,), {"pages": pages})
+    original = parsing.PyPDF2.PdfReader
+    parsing.PyPDF2.PdfReader = reader
+    try:
+        yield
+    finally:
+        parsing.PyPDF2.PdfReader = original
+
+
+def legacy_text(pages, max_pages, max_chars):
+    """The original extraction: whole document in one string, cleaned once"""
+    text = ""
+    for content in pages[:max_pages]:
+        if content:
+            text += content + "\n"
+    text = clean_text(text)
+    if max_chars is not None:
+        text = text[:max_chars].rstrip()
+    return text
+
+
+def check(name, pages):
+    """Mismatch descriptions for one document over every page and character limit"""
+    failures = []
+    full = legacy_text(pages, None, None)
+    for max_pages in (None, 1, 2, len(pages)):
+        for max_chars in [None] + list(range(len(full) + 2)):
+            expected = legacy_text(pages, max_pages, max_chars)
+            with fake_pdf(pages):
+                got = parsing.extract_text(io.BytesIO(b""), name + ".pdf", max_pages=max_pages, max_chars=max_chars)
+            if got != expected:
+                failures.append(f"{name} max_pages={max_pages} max_chars={max_chars}: {got!r} != {expected!r}")
+    return failures
+
+
+def main():
+    failures = []
+    for name, pages in DOCUMENTS.items():
+        failures.extend(check(name, pages))
+
+    print(f"{len(DOCUMENTS)} documents, {len(failures)} mismatches")
+    if failures:
+        print("PDF parity check failed:\n  " + "\n  ".join(failures[:20]), file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,189 @@
+# ----------------------------------------------------------
+# SkillGapAI - Stage benchmark suite
+# ----------------------------------------------------------
+# Times each pipeline stage on a reproducible synthetic corpus and
+# compares the medians against a stored baseline:
+#
+#   python -m benchmarks.run --out bench.json
+#   python -m benchmarks.run --save-baseline benchmarks/baseline.json
+#   python -m benchmarks.run --baseline benchmarks/baseline.json --threshold 0.2
+#
+# A baseline recorded with a different config fails the run, since nothing
+# would be compared; --allow-config-mismatch skips the comparison instead.
+#
+# Model-backed stages use offline stubs unless --real is given. With --real,
+# zero-shot backends can be timed side by side on the same documents:
+#
+#   python -m benchmarks.run --real --zero-shot torch int8 onnx=models/bart-onnx
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+
+import numpy as np
+
+from benchmarks import stubs
+from benchmarks.corpus import synthetic_documents, synthetic_taxonomy
+from skillgap import SkillMatcher, categorized_skills, clean_text, extractor, highlight_html
+from skillgap.cascade import extract_skills_cascade_batch
+from skillgap.similarity import match_skills
+from skillgap.taxonomy import Taxonomy
+from skillgap.zero_shot import load_classifier
+
+
+def time_stage(fn, repeat, warmup=1):
+    for _ in range(warmup):
+        fn()
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - start) * 1000)
+    return {
+        "median_ms": round(statistics.median(timings), 3),
+        "min_ms": round(min(timings), 3),
+        "max_ms": round(max(timings), 3),
+        "runs": repeat,
+    }
+
+
+def build_stages(config):
+    """Stage name -> zero-argument callable, all over the same corpus"""
+    taxonomy = synthetic_taxonomy(config["taxonomy_size"], seed=config["seed"], base=extractor.get_skill_db())
+    documents = synthetic_documents(taxonomy, config["documents"], config["document_words"], seed=config["seed"])
+    matcher = SkillMatcher(taxonomy)
+    found = [[s for skills in categorized_skills(matcher, d).values() for s in skills] for d in documents]
+
+    if config["stub_models"]:
+        stubs.install(extractor, taxonomy=Taxonomy(taxonomy))
+    else:
+        extractor.set_models(taxonomy=Taxonomy(taxonomy))
+
+    rng = np.random.default_rng(config["seed"])
+    resume_embeddings = rng.standard_normal((config["match_rows"], 384)).astype(np.float32)
+    job_embeddings = rng.standard_normal((config["match_cols"], 384)).astype(np.float32)
+    resume_skills = [f"r{i}" for i in range(config["match_rows"])]
+    job_skills = [f"j{i}" for i in range(config["match_cols"])]
+
+    stages = {
+        "clean_text": lambda: [clean_text(d) for d in documents],
+        "matcher_build": lambda: SkillMatcher(taxonomy),
+        "matcher_scan": lambda: [categorized_skills(matcher, d) for d in documents],
+        "highlight": lambda: [highlight_html(matcher, d, s) for d, s in zip(documents, found)],
+        "similarity_match": lambda: match_skills(resume_skills, job_skills, resume_embeddings, job_embeddings, top_k=3),
+        "extract_skills": lambda: [extractor.extract_skills(d) for d in documents],
+        "extract_skills_batch": lambda: extractor.extract_skills_batch(documents, batch_size=32),
+        "extract_skills_cascade": lambda: extract_skills_cascade_batch(documents, budget_ms=0),
+    }
+
+    # One stage per zero-shot backend, all scoring the same documents and labels
+    labels = extractor.all_skill_labels()[:config["zero_shot_labels"]]
+    for spec in config["zero_shot"]:
+        backend, _, model_dir = spec.partition("=")
+        classifier = load_classifier(backend, model_dir or None, model=extractor.BERT_MODEL)
+        stages[f"zero_shot[{backend}]"] = (
+            lambda c=classifier: c(documents, candidate_labels=labels, multi_label=True, batch_size=32)
+        )
+    return stages
+
+
+def compare(results, baseline, threshold):
+    """Stages whose median got slower than the baseline by more than threshold"""
+    if baseline.get("config") != results["config"]:
+        raise ValueError("Baseline was recorded with a different config")
+    regressions = []
+    for stage, current in results["stages"].items():
+        before = baseline["stages"].get(stage)
+        if not before or not before["median_ms"]:
+            continue
+        ratio = current["median_ms"] / before["median_ms"]
+        current["vs_baseline"] = round(ratio, 3)
+        if ratio > 1 + threshold:
+            regressions.append(f"{stage}: {before['median_ms']} ms -> {current['median_ms']} ms ({ratio:.2f}x)")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="SkillGapAI stage benchmarks")
+    parser.add_argument("--documents", type=int, default=20)
+    parser.add_argument("--document-words", type=int, default=2000)
+    parser.add_argument("--taxonomy-size", type=int, default=5000)
+    parser.add_argument("--match-rows", type=int, default=1000)
+    parser.add_argument("--match-cols", type=int, default=5000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--stages", nargs="+", help="only run these stages")
+    parser.add_argument("--real", action="store_true", help="use the real models instead of stubs")
+    parser.add_argument("--zero-shot", nargs="+", default=[], metavar="BACKEND[=DIR]",
+                        help="with --real, time these zero-shot backends (torch, int8, onnx)")
+    parser.add_argument("--zero-shot-labels", type=int, default=20, help="labels scored per zero-shot stage")
+    parser.add_argument("--out", help="write results JSON here (default: stdout)")
+    parser.add_argument("--baseline", help="baseline JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=0.2, help="allowed slowdown vs baseline")
+    parser.add_argument("--allow-config-mismatch", action="store_true",
+                        help="skip the comparison instead of failing when the baseline config differs")
+    parser.add_argument("--save-baseline", help="write these results as the new baseline")
+    args = parser.parse_args()
+
+    config = {
+        "documents": args.documents,
+        "document_words": args.document_words,
+        "taxonomy_size": args.taxonomy_size,
+        "match_rows": args.match_rows,
+        "match_cols": args.match_cols,
+        "seed": args.seed,
+        "stub_models": not args.real,
+        "zero_shot": args.zero_shot,
+        "zero_shot_labels": args.zero_shot_labels,
+    }
+    if args.zero_shot and not args.real:
+        parser.error("--zero-shot needs --real")
+    stages = build_stages(config)
+    selected = args.stages or list(stages)
+
+    results = {
+        "config": config,
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "stages": {},
+    }
+    for name in selected:
+        results["stages"][name] = time_stage(stages[name], args.repeat)
+        print(f"{name}: {results['stages'][name]['median_ms']} ms", file=sys.stderr)
+
+    regressions = []
+    mismatch = None
+    if args.baseline:
+        with open(args.baseline, "r") as f:
+            baseline = json.load(f)
+        try:
+            regressions = compare(results, baseline, args.threshold)
+        except ValueError as e:
+            mismatch = str(e)
+        results["regressions"] = regressions
+
+    output = json.dumps(results, indent=2)
+    if args.out:
+        with open(args.out, "w") as f:
+            f.write(output + "\n")
+    else:
+        print(output)
+    if args.save_baseline:
+        with open(args.save_baseline, "w") as f:
+            f.write(output + "\n")
+
+    if mismatch:
+        if not args.allow_config_mismatch:
+            print(f"{mismatch}; re-record it or pass --allow-config-mismatch", file=sys.stderr)
+            sys.exit(1)
+        print(f"{mismatch}; skipping comparison", file=sys.stderr)
+    if regressions:
+        print("Regressions above threshold:\n  " + "\n  ".join(regressions), file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
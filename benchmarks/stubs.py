@@ -0,0 +1,80 @@
+"""Offline stand-ins for the spaCy, zero-shot and embedding models.
+
+They keep the extractor's control flow (batching, shortlisting, chunk
+filtering) intact while costing little, so model-backed stages can be
+timed without downloads.
+"""
+
+import zlib
+
+import numpy as np
+
+
+class _Span:
+    def __init__(self, start_char, end_char):
+        self.start_char = start_char
+        self.end_char = end_char
+
+
+class _Doc:
+    def __init__(self, text):
+        self.text = text
+        # One noun chunk per sentence-ish segment
+        self.noun_chunks = []
+        start = 0
+        for i, c in enumerate(text):
+            if c in ".\n":
+                self.noun_chunks.append(_Span(start, i))
+                start = i + 1
+        self.noun_chunks.append(_Span(start, len(text)))
+
+
+class StubNLP:
+    def __call__(self, text):
+        return _Doc(text)
+
+    def pipe(self, texts, batch_size=None):
+        for text in texts:
+            yield _Doc(text)
+
+
+class StubClassifier:
+    """Scores a label 0.9 when it appears in the text, else a small share"""
+
+    def _score(self, text, candidate_labels):
+        lowered = text.lower()
+        scores = [0.9 if label.lower() in lowered else 0.1 / len(candidate_labels) for label in candidate_labels]
+        order = sorted(range(len(scores)), key=lambda i: -scores[i])
+        return {
+            "sequence": text,
+            "labels": [candidate_labels[i] for i in order],
+            "scores": [scores[i] for i in order],
+        }
+
+    def __call__(self, texts, candidate_labels, batch_size=None, **kwargs):
+        if isinstance(texts, str):
+            return self._score(texts, candidate_labels)
+        return [self._score(text, candidate_labels) for text in texts]
+
+
+class StubEmbedder:
+    """Deterministic hashed random vectors, MiniLM-sized"""
+
+    dim = 384
+
+    def encode(self, texts, batch_size=None, normalize_embeddings=False, **kwargs):
+        vectors = np.stack([
+            np.random.default_rng(zlib.crc32(t.encode("utf-8"))).standard_normal(self.dim).astype(np.float32)
+            for t in texts
+        ]) if len(texts) else np.zeros((0, self.dim), dtype=np.float32)
+        if normalize_embeddings:
+            vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+        return vectors
+
+
+def install(extractor, taxonomy=None):
+    """Swap the extractor's models for stubs (and optionally its taxonomy)"""
+    models = {"nlp": StubNLP(), "bert_classifier": StubClassifier(), "embedder": StubEmbedder()}
+    if taxonomy is not None:
+        models["taxonomy"] = taxonomy
+    extractor.set_models(**models)
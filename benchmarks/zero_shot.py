@@ -0,0 +1,121 @@
+# ----------------------------------------------------------
+# SkillGapAI - Zero-shot backend parity and latency check
+# ----------------------------------------------------------
+# Scores a fixed corpus with the fp32 pipeline and with a cheaper backend,
+# then reports label agreement, score drift and latency:
+#
+#   python -m benchmarks.zero_shot --backend int8
+#   python -m benchmarks.zero_shot --backend onnx --model-dir models/bart-onnx
+#
+# Exits non-zero when agreement or drift is outside the given limits.
+
+import argparse
+import json
+import statistics
+import sys
+import time
+
+from benchmarks.corpus import synthetic_documents
+from skillgap import extractor
+from skillgap.zero_shot import BACKENDS, load_classifier
+
+THRESHOLD = extractor.CONFIDENCE_THRESHOLD
+
+
+def score_corpus(classifier, documents, labels, batch_size):
+    """Per-document {label: score} and per-document latency in ms"""
+    scores, latencies = [], []
+    for i in range(0, len(documents), batch_size):
+        batch = documents[i:i + batch_size]
+        start = time.perf_counter()
+        outputs = classifier(batch, candidate_labels=labels, multi_label=True, batch_size=batch_size)
+        elapsed = (time.perf_counter() - start) * 1000
+        if isinstance(outputs, dict):
+            outputs = [outputs]
+        scores.extend(dict(zip(out["labels"], out["scores"])) for out in outputs)
+        latencies.extend([elapsed / len(batch)] * len(batch))
+    return scores, latencies
+
+
+def parity(reference, candidate):
+    """Label agreement and score drift of candidate scores against reference"""
+    same_labels = same_top = 0
+    drift = []
+    for ref, cand in zip(reference, candidate):
+        same_labels += {l for l, s in ref.items() if s > THRESHOLD} == {l for l, s in cand.items() if s > THRESHOLD}
+        same_top += max(ref, key=ref.get) == max(cand, key=cand.get)
+        drift.extend(abs(ref[label] - cand[label]) for label in ref)
+    n = len(reference)
+    return {
+        "label_agreement": round(same_labels / n, 4),
+        "top_label_agreement": round(same_top / n, 4),
+        "mean_score_drift": round(statistics.mean(drift), 5),
+        "max_score_drift": round(max(drift), 5),
+    }
+
+
+def latency(latencies):
+    return {
+        "median_ms": round(statistics.median(latencies), 2),
+        "mean_ms": round(statistics.mean(latencies), 2),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare a zero-shot backend against the fp32 pipeline")
+    parser.add_argument("--backend", choices=BACKENDS, required=True)
+    parser.add_argument("--model-dir", help="local model directory for the backend")
+    parser.add_argument("--documents", type=int, default=50)
+    parser.add_argument("--document-words", type=int, default=150)
+    parser.add_argument("--batch-size", type=int, default=8)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--min-agreement", type=float, default=0.95, help="minimum label agreement")
+    parser.add_argument("--max-drift", type=float, default=0.05, help="maximum mean score drift")
+    parser.add_argument("--out", help="write results JSON here (default: stdout)")
+    args = parser.parse_args()
+
+    taxonomy = extractor.get_skill_db()
+    labels = extractor.all_skill_labels()
+    documents = synthetic_documents(taxonomy, args.documents, args.document_words, seed=args.seed)
+
+    reference = load_classifier("torch", model=extractor.BERT_MODEL)
+    candidate = load_classifier(args.backend, args.model_dir, model=extractor.BERT_MODEL)
+
+    # One untimed call each so lazy initialisation is not counted
+    reference(documents[0], candidate_labels=labels, multi_label=True)
+    candidate(documents[0], candidate_labels=labels, multi_label=True)
+
+    ref_scores, ref_latencies = score_corpus(reference, documents, labels, args.batch_size)
+    cand_scores, cand_latencies = score_corpus(candidate, documents, labels, args.batch_size)
+
+    results = {
+        "backend": args.backend,
+        "model_dir": args.model_dir,
+        "documents": len(documents),
+        "labels": len(labels),
+        "parity": parity(ref_scores, cand_scores),
+        "latency": {"torch": latency(ref_latencies), args.backend: latency(cand_latencies)},
+    }
+    results["latency"]["speedup"] = round(
+        results["latency"]["torch"]["median_ms"] / results["latency"][args.backend]["median_ms"], 2
+    )
+
+    output = json.dumps(results, indent=2)
+    if args.out:
+        with open(args.out, "w") as f:
+            f.write(output + "\n")
+    else:
+        print(output)
+
+    failures = []
+    if results["parity"]["label_agreement"] < args.min_agreement:
+        failures.append(f"label agreement {results['parity']['label_agreement']} < {args.min_agreement}")
+    if results["parity"]["mean_score_drift"] > args.max_drift:
+        failures.append(f"mean score drift {results['parity']['mean_score_drift']} > {args.max_drift}")
+    if failures:
+        print("Parity check failed:\n  " + "\n  ".join(failures), file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
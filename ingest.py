@@ -0,0 +1,248 @@
+# ----------------------------------------------------------
+# SkillGapAI - Bulk ingestion CLI
+# ----------------------------------------------------------
+# Parses a directory, .zip or .tar(.gz) of PDF/DOCX/TXT resumes and job
+# descriptions in a process pool, extracts skills with the extractor
+# engine and writes one record per document:
+#
+#   python ingest.py resumes/ --out resumes.jsonl --workers 8
+#   python ingest.py resumes.zip --out resumes.parquet --format parquet
+
+import argparse
+import io
+import json
+import os
+import sys
+import tarfile
+import time
+import zipfile
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from skillgap import parsing
+
+SUPPORTED_EXTENSIONS = (".pdf", ".docx", ".txt")
+
+
+def _supported(name):
+    return name.lower().endswith(SUPPORTED_EXTENSIONS)
+
+
+def iter_documents(source):
+    """Yield ``(name, path, data)`` per document; archives are read into ``data``"""
+    if os.path.isdir(source):
+        for root, dirs, files in os.walk(source):
+            dirs.sort()
+            for file_name in sorted(files):
+                if _supported(file_name):
+                    path = os.path.join(root, file_name)
+                    yield os.path.relpath(path, source), path, None
+
+    elif zipfile.is_zipfile(source):
+        with zipfile.ZipFile(source) as archive:
+            for member in archive.infolist():
+                if not member.is_dir() and _supported(member.filename):
+                    yield member.filename, None, archive.read(member)
+
+    elif tarfile.is_tarfile(source):
+        with tarfile.open(source) as archive:
+            for member in archive:
+                if member.isfile() and _supported(member.name):
+                    yield member.name, None, archive.extractfile(member).read()
+
+    elif _supported(source):
+        yield os.path.basename(source), source, None
+
+    else:
+        raise ValueError(f"Not a directory, archive or supported document: {source}")
+
+
+def parse_document(name, path, data):
+    """Parse one document; errors are returned, not raised, so a run never stops"""
+    try:
+        source = path if data is None else io.BytesIO(data)
+        text = parsing.extract_text(source, name)
+        return {"path": name, "text": text, "error": None}
+    except Exception as e:
+        return {"path": name, "text": "", "error": f"{type(e).__name__}: {e}"}
+
+
+def parse_all(documents, workers):
+    """Parse documents in a process pool, keeping a bounded number in flight"""
+    if workers <= 1:
+        for document in documents:
+            yield parse_document(*document)
+        return
+
+    documents = iter(documents)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = set()
+        exhausted = False
+        while pending or not exhausted:
+            while not exhausted and len(pending) < workers * 4:
+                document = next(documents, None)
+                if document is None:
+                    exhausted = True
+                else:
+                    pending.add(pool.submit(parse_document, *document))
+            if not pending:
+                break
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+
+
+def add_skills(records, batch_size):
+    """Attach extracted skills to parsed records, one batched model call per chunk"""
+    from skillgap.extractor import extract_skills_batch
+
+    batch = []
+
+    def flush():
+        todo = [r for r in batch if not r["error"] and r["text"]]
+        for r in batch:
+            r["skills"] = []
+        try:
+            results = extract_skills_batch([r["text"] for r in todo], batch_size=batch_size) if todo else []
+        except Exception:
+            # One bad document must not fail the run: retry one by one to find it
+            results = None
+        if results is not None:
+            for r, skills in zip(todo, results):
+                r["skills"] = sorted(skills)
+        else:
+            for r in todo:
+                try:
+                    r["skills"] = sorted(extract_skills_batch([r["text"]], batch_size=1)[0])
+                except Exception as e:
+                    r["error"] = f"{type(e).__name__}: {e}"
+        done = list(batch)
+        batch.clear()
+        return done
+
+    for record in records:
+        batch.append(record)
+        if len(batch) >= batch_size:
+            yield from flush()
+    if batch:
+        yield from flush()
+
+
+class JsonlWriter:
+    def __init__(self, path):
+        self._file = sys.stdout if path == "-" else open(path, "w", encoding="utf-8")
+
+    def write(self, record):
+        self._file.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+    def close(self):
+        if self._file is not sys.stdout:
+            self._file.close()
+
+
+class ParquetWriter:
+    """Writes records in row groups so memory stays bounded"""
+
+    def __init__(self, path, row_group_size=1000):
+        import pyarrow  # noqa: F401 - fail fast if the optional dependency is missing
+
+        self.path = path
+        self.row_group_size = row_group_size
+        self._rows = []
+        self._writer = None
+
+    def write(self, record):
+        self._rows.append(record)
+        if len(self._rows) >= self.row_group_size:
+            self._flush()
+
+    def _flush(self):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        if not self._rows:
+            return
+        if self._writer is None:
+            types = {"skills": pa.list_(pa.string()), "chars": pa.int64()}
+            schema = pa.schema([(key, types.get(key, pa.string())) for key in self._rows[0]])
+            self._writer = pq.ParquetWriter(self.path, schema)
+        table = pa.Table.from_pylist(self._rows, schema=self._writer.schema)
+        self._writer.write_table(table)
+        self._rows = []
+
+    def close(self):
+        self._flush()
+        if self._writer is not None:
+            self._writer.close()
+
+
+def open_writer(path, output_format):
+    if output_format == "parquet":
+        return ParquetWriter(path)
+    return JsonlWriter(path)
+
+
+def run(sources, out, output_format="jsonl", workers=None, with_skills=True,
+        batch_size=32, include_text=False, progress_every=100):
+    """Ingest every document under sources; returns the run summary"""
+    workers = workers or os.cpu_count() or 1
+    documents = (doc for source in sources for doc in iter_documents(source))
+    records = parse_all(documents, workers)
+    if with_skills:
+        records = add_skills(records, batch_size)
+
+    writer = open_writer(out, output_format)
+    start = time.perf_counter()
+    processed = failed = 0
+    try:
+        for record in records:
+            processed += 1
+            if record["error"]:
+                failed += 1
+            record["chars"] = len(record["text"])
+            if not include_text:
+                del record["text"]
+            writer.write(record)
+
+            if progress_every and processed % progress_every == 0:
+                elapsed = time.perf_counter() - start
+                print(f"{processed} files, {failed} errors, {processed / elapsed:.1f} files/s", file=sys.stderr)
+    finally:
+        writer.close()
+
+    elapsed = time.perf_counter() - start
+    return {
+        "files": processed,
+        "errors": failed,
+        "seconds": round(elapsed, 3),
+        "files_per_second": round(processed / elapsed, 2) if elapsed else 0.0,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bulk-parse resumes and job descriptions")
+    parser.add_argument("sources", nargs="+", help="directories, .zip/.tar archives or files")
+    parser.add_argument("--out", default="-", help="output file ('-' for stdout, JSONL only)")
+    parser.add_argument("--format", choices=["jsonl", "parquet"], default="jsonl")
+    parser.add_argument("--workers", type=int, default=None, help="parser processes (default: CPU count)")
+    parser.add_argument("--batch-size", type=int, default=32, help="documents per skill-extraction batch")
+    parser.add_argument("--no-skills", action="store_true", help="only parse, skip skill extraction")
+    parser.add_argument("--include-text", action="store_true", help="store the cleaned text in each record")
+    args = parser.parse_args()
+
+    if args.format == "parquet" and args.out == "-":
+        parser.error("--format parquet needs --out")
+
+    summary = run(
+        args.sources,
+        args.out,
+        output_format=args.format,
+        workers=args.workers,
+        with_skills=not args.no_skills,
+        batch_size=args.batch_size,
+        include_text=args.include_text,
+    )
+    print(json.dumps(summary), file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
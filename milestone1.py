@@ -3,9 +3,9 @@
 # ----------------------------------------------------------
 
 import streamlit as st
-import docx2txt
-import PyPDF2
-import re
+
+from skillgap import parsing
+from skillgap.text import clean_text
 
 # ----------------------------------------------------------
 # PAGE CONFIGURATION
@@ -28,35 +28,14 @@ st.markdown(
 # FUNCTIONS
 # ----------------------------------------------------------
 
-def clean_text(text):
-    """Normalize text by removing extra spaces and line breaks"""
-    text = re.sub(r'\s+', ' ', text)
-    text = text.replace('\r', '').replace('\n', ' ')
-    return text.strip()
-
-
 def extract_text(uploaded_file):
     """Extract plain text from PDF, DOCX, or TXT"""
-    text = ""
     try:
-        if uploaded_file.name.lower().endswith(".pdf"):
-            pdf_reader = PyPDF2.PdfReader(uploaded_file)
-            for page in pdf_reader.pages:
-                content = page.extract_text()
-                if content:
-                    text += content + "\n"
-
-        elif uploaded_file.name.lower().endswith(".docx"):
-            text = docx2txt.process(uploaded_file)
+        return parsing.extract_text(uploaded_file, uploaded_file.name)
 
-        elif uploaded_file.name.lower().endswith(".txt"):
-            text = uploaded_file.read().decode("utf-8")
-
-        else:
-            st.error("❌ Unsupported file format.")
-            return ""
-
-        return clean_text(text)
+    except parsing.UnsupportedFormatError:
+        st.error("❌ Unsupported file format.")
+        return ""
 
     except Exception as e:
         st.error(f"⚠️ Error extracting text: {e}")
@@ -1,9 +1,19 @@
 import streamlit as st
 import spacy
-import re
+import io
 import matplotlib.pyplot as plt
 from datetime import datetime
 
+from skillgap import (
+    categorized_skills,
+    clean_text,
+    highlight_html,
+    skill_confidences,
+    skill_gap,
+)
+from skillgap.extractor import SKILLS_PATH
+from skillgap.taxonomy import load_taxonomy
+
 # ------------------------------------------
 # PAGE CONFIGURATION
 # ------------------------------------------
@@ -294,56 +304,79 @@ def load_model():
 nlp = load_model()
 
 # ------------------------------------------
-# SKILL LISTS
+# SKILL TAXONOMY
 # ------------------------------------------
-technical_skills = [
-    "python", "java", "c++", "sql", "html", "css", "javascript", "react", "node.js",
-    "tensorflow", "pytorch", "machine learning", "data analysis", "data visualization",
-    "aws", "azure", "gcp", "power bi", "tableau", "django", "flask", "scikit-learn", "nlp"
-]
+# skills.json (or its compiled index), shared with the API; aliases such
+# as "k8s" are reported under their canonical skill.
+@st.cache_resource
+def load_skill_taxonomy():
+    return load_taxonomy(SKILLS_PATH)
 
-soft_skills = [
-    "communication", "leadership", "teamwork", "problem solving", "time management",
-    "adaptability", "critical thinking", "creativity", "collaboration", "decision making"
-]
+skill_matcher = load_skill_taxonomy().matcher
 
 # ------------------------------------------
 # HELPERS
 # ------------------------------------------
-def clean_text(text: str) -> str:
-    text = re.sub(r"\s+", " ", text)
-    text = re.sub(r"[^\w\s]", " ", text)
-    return text.lower().strip()
+# Every widget interaction reruns this script, so analysis results and the
+# chart are cached on their inputs and only recomputed when those change.
 
+@st.cache_data(max_entries=64, show_spinner=False)
 def extract_skills(text):
-    text_clean = clean_text(text)
-    found_tech = [skill.title() for skill in technical_skills if skill in text_clean]
-    found_soft = [skill.title() for skill in soft_skills if skill in text_clean]
-    return list(set(found_tech)), list(set(found_soft))
+    found = categorized_skills(skill_matcher, clean_text(text))
+    found_tech = [skill.title() for skill in found.get("technical", [])]
+    found_soft = [skill.title() for skill in found.get("soft", [])]
+    return found_tech, found_soft
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def analyze(resume_text, jd_text):
+    tech_resume, soft_resume = extract_skills(resume_text) if resume_text else ([], [])
+    tech_jd, soft_jd = extract_skills(jd_text) if jd_text else ([], [])
+    resume_all_skills = set(tech_resume + soft_resume)
+    jd_all_skills = set(tech_jd + soft_jd)
+    return {
+        "tech_resume": tech_resume,
+        "soft_resume": soft_resume,
+        "tech_jd": tech_jd,
+        "soft_jd": soft_jd,
+        "resume_all_skills": resume_all_skills,
+        "jd_all_skills": jd_all_skills,
+        "gap": skill_gap(resume_all_skills, jd_all_skills),
+    }
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def cached_confidences(skills):
+    return skill_confidences(list(skills))
 
+@st.cache_data(max_entries=32, show_spinner=False)
 def highlight_text(text: str, skills):
     if not text:
         return ""
-    highlighted = text
-    for skill in sorted(skills, key=len, reverse=True):
-        pattern = re.compile(re.escape(skill), re.IGNORECASE)
-        highlighted = pattern.sub(
-            lambda m: f"<span class='highlight'>{m.group(0)}</span>",
-            highlighted,
-        )
-    highlighted = highlighted.replace("\n", "<br>")
-    return highlighted
-
-def skill_confidences(skills):
-    n = len(skills)
-    if n == 0:
-        return {}
-    start = 96
-    step = 10 / max(n - 1, 1)
-    conf = {}
-    for i, s in enumerate(skills):
-        conf[s] = max(75, round(start - i * step))
-    return conf
+    return highlight_html(skill_matcher, text, skills)
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def skill_donut_png(tech_count, soft_count):
+    fig, ax = plt.subplots(figsize=(3.5, 3.5))
+    sizes = [tech_count, soft_count]
+    labels = ["Technical Skills", "Soft Skills"]
+    wedges, _ = ax.pie(
+        sizes,
+        labels=None,
+        startangle=90,
+        wedgeprops=dict(width=0.35, edgecolor="white"),
+    )
+    ax.axis("equal")
+    ax.legend(
+        wedges,
+        labels,
+        loc="lower center",
+        bbox_to_anchor=(0.5, -0.12),
+        ncol=2,
+        fontsize=8,
+    )
+    buf = io.BytesIO()
+    fig.savefig(buf, format="png", bbox_inches="tight")
+    plt.close(fig)
+    return buf.getvalue()
 
 # ------------------------------------------
 # SESSION STATE FOR LAST UPDATED
@@ -365,21 +398,13 @@ with st.expander("✏️ Input: Paste Resume & Job Description Text", expanded=F
 
 has_any_text = bool(resume_text or jd_text)
 
-# Extract skills
-tech_resume, soft_resume = ([], [])
-tech_jd, soft_jd = ([], [])
-
-if resume_text:
-    tech_resume, soft_resume = extract_skills(resume_text)
-if jd_text:
-    tech_jd, soft_jd = extract_skills(jd_text)
-
-# Sets for comparison
-resume_all_skills = set(tech_resume + soft_resume)
-jd_all_skills = set(tech_jd + soft_jd)
-common_skills = sorted(resume_all_skills & jd_all_skills)
-missing_in_resume = sorted(jd_all_skills - resume_all_skills)
-extra_in_resume = sorted(resume_all_skills - jd_all_skills)
+# Extract skills and compare (cached on the two texts)
+analysis = analyze(resume_text, jd_text)
+tech_resume, soft_resume = analysis["tech_resume"], analysis["soft_resume"]
+tech_jd, soft_jd = analysis["tech_jd"], analysis["soft_jd"]
+resume_all_skills = analysis["resume_all_skills"]
+jd_all_skills = analysis["jd_all_skills"]
+common_skills, missing_in_resume, extra_in_resume = analysis["gap"]
 
 # Update last updated only when analysis has some skills/text
 if has_any_text and (tech_resume or soft_resume or tech_jd or soft_jd):
@@ -455,7 +480,7 @@ with st.container():
         elif not all_src_skills:
             st.warning(f"No configured skills were detected in the {src_name.lower()} text.")
         else:
-            conf = skill_confidences(all_src_skills)
+            conf = cached_confidences(tuple(all_src_skills))
             chips_html = ""
 
             for skill in src_tech:
@@ -471,7 +496,7 @@ with st.container():
         st.markdown("##### ✏️ Highlighted Text")
 
         if src_text:
-            highlighted_html = highlight_text(src_text, all_src_skills)
+            highlighted_html = highlight_text(src_text, tuple(all_src_skills))
             st.markdown(
                 f"<div class='highlight-box'>{highlighted_html}</div>",
                 unsafe_allow_html=True,
@@ -499,29 +524,11 @@ with st.container():
             soft_count = len(soft_selected)
             total_count = tech_count + soft_count
 
-            conf = skill_confidences(all_selected)
+            conf = cached_confidences(tuple(all_selected))
             avg_conf = round(sum(conf.values()) / len(conf)) if conf else 0
 
             if total_count > 0:
-                fig, ax = plt.subplots(figsize=(3.5, 3.5))
-                sizes = [tech_count, soft_count]
-                labels = ["Technical Skills", "Soft Skills"]
-                wedges, _ = ax.pie(
-                    sizes,
-                    labels=None,
-                    startangle=90,
-                    wedgeprops=dict(width=0.35, edgecolor="white"),
-                )
-                ax.axis("equal")
-                ax.legend(
-                    wedges,
-                    labels,
-                    loc="lower center",
-                    bbox_to_anchor=(0.5, -0.12),
-                    ncol=2,
-                    fontsize=8,
-                )
-                st.pyplot(fig, use_container_width=True)
+                st.image(skill_donut_png(tech_count, soft_count), use_container_width=True)
             else:
                 st.write("No skills detected yet for a chart.")
 
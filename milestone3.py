@@ -1,11 +1,13 @@
 import streamlit as st
 import numpy as np
 import pandas as pd
-import seaborn as sns
 import matplotlib.pyplot as plt
 
 from sentence_transformers import SentenceTransformer
-from sklearn.metrics.pairwise import cosine_similarity
+
+from skillgap.embedding_store import EmbeddingStore
+from skillgap.plots import matrix_hash, similarity_heatmap_png
+from skillgap.similarity import cosine_matrix, match_skills
 
 # -----------------------------
 # Page Config
@@ -44,15 +46,20 @@ job_skills = [s.strip() for s in job_skills_text.split(",") if s.strip()]
 def load_model():
     return SentenceTransformer("all-MiniLM-L6-v2")
 
+@st.cache_resource
+def load_embedding_store():
+    return EmbeddingStore(model_name="all-MiniLM-L6-v2")
+
 model = load_model()
+embedding_store = load_embedding_store()
 
 # -----------------------------
 # Skill Similarity
 # -----------------------------
-resume_embeddings = model.encode(resume_skills)
-job_embeddings = model.encode(job_skills)
+resume_embeddings = embedding_store.encode(resume_skills, model)
+job_embeddings = embedding_store.encode(job_skills, model)
 
-similarity_matrix = cosine_similarity(resume_embeddings, job_embeddings)
+similarity_matrix = cosine_matrix(resume_embeddings, job_embeddings)
 
 df_similarity = pd.DataFrame(
     similarity_matrix,
@@ -66,34 +73,25 @@ st.markdown("### Skill Similarity Matrix (BERT-based Cosine Similarity)")
 # -----------------------------
 # Heatmap
 # -----------------------------
-fig, ax = plt.subplots(figsize=(12, 4))
-sns.heatmap(
-    df_similarity,
-    annot=True,
-    cmap="Blues",
-    fmt=".2f",
-    ax=ax
-)
-st.pyplot(fig)
+@st.cache_data(max_entries=16, show_spinner=False)
+def heatmap_png(key, _matrix, row_labels, col_labels):
+    # Cached on the matrix hash; the matrix itself is not hashed by Streamlit
+    return similarity_heatmap_png(_matrix, row_labels, col_labels)
+
+if similarity_matrix.size:
+    heatmap_key = matrix_hash(similarity_matrix, resume_skills, job_skills)
+    st.image(heatmap_png(heatmap_key, similarity_matrix, resume_skills, job_skills), use_container_width=True)
+else:
+    st.info("Enter resume and job skills to see the similarity matrix.")
 
 # -----------------------------
 # Matching Logic
 # -----------------------------
-MATCH_THRESHOLD = 0.75
-PARTIAL_THRESHOLD = 0.4
-
-matched = []
-partial = []
-missing = []
+result = match_skills(resume_skills, job_skills, resume_embeddings, job_embeddings)
 
-for job_skill in job_skills:
-    max_sim = df_similarity[job_skill].max()
-    if max_sim >= MATCH_THRESHOLD:
-        matched.append(job_skill)
-    elif max_sim >= PARTIAL_THRESHOLD:
-        partial.append(job_skill)
-    else:
-        missing.append(job_skill)
+matched = result["matched"]
+partial = result["partial"]
+missing = result["missing"]
 
 total = len(job_skills)
 overall_match = (len(matched) / total) * 100 if total else 0
@@ -141,5 +139,26 @@ else:
 # -----------------------------
 # Detailed Skill Comparison
 # -----------------------------
+PAGE_SIZE = 25
+
 with st.expander("📌 Detailed Skill Comparison"):
-    st.dataframe(df_similarity.round(2))
+    # Paginated drill-down so large matrices only send one page to the browser
+    row_pages = max(1, -(-len(resume_skills) // PAGE_SIZE))
+    col_pages = max(1, -(-len(job_skills) // PAGE_SIZE))
+    if row_pages > 1 or col_pages > 1:
+        page_r, page_c = st.columns(2)
+        row_page = page_r.number_input("Resume skills page", 1, row_pages, 1)
+        col_page = page_c.number_input("Job skills page", 1, col_pages, 1)
+        rows = slice((row_page - 1) * PAGE_SIZE, row_page * PAGE_SIZE)
+        cols = slice((col_page - 1) * PAGE_SIZE, col_page * PAGE_SIZE)
+        st.dataframe(df_similarity.iloc[rows, cols].round(2))
+    else:
+        st.dataframe(df_similarity.round(2))
+
+    st.markdown("**Best resume match for each job skill**")
+    st.dataframe(pd.DataFrame({
+        "Job Skill": job_skills,
+        "Best Resume Match": result["best_match"],
+        "Similarity": np.round(result["best_score"], 2),
+        "Status": result["status"],
+    }))
@@ -7,7 +7,8 @@ import streamlit as st
 import pandas as pd
 import matplotlib.pyplot as plt
 import numpy as np
-from fpdf import FPDF
+
+from skillgap import report
 
 st.set_page_config(page_title="SkillGapAI - Dashboard", layout="wide")
 
@@ -150,35 +151,30 @@ st.download_button(
 # -------------------------------------------------------
 # PDF Report Export
 # -------------------------------------------------------
-def generate_pdf():
-    pdf = FPDF()
-    pdf.add_page()
-    pdf.set_font("Arial", size=12)
-
-    pdf.cell(200, 10, txt="SkillGapAI - Skill Gap Report", ln=True, align='C')
-    pdf.ln(10)
-
-    pdf.cell(200, 10, txt=f"Overall Match: {overall_match}%", ln=True)
-    pdf.cell(200, 10, txt=f"Matched Skills: {matched}", ln=True)
-    pdf.cell(200, 10, txt=f"Missing Skills: {missing}", ln=True)
-
-    pdf.ln(10)
-    pdf.cell(200, 10, txt="Skill Comparison:", ln=True)
-
-    for i, row in skills_df.iterrows():
-        pdf.cell(200, 10, txt=f"{row['Skill']} - Resume: {row['Resume Score']}%, Job: {row['Job Requirement Score']}%", ln=True)
-
-    return pdf.output(dest='S').encode('latin1')
-
-
-pdf_data = generate_pdf()
-
-st.download_button(
-    label="📄 Download Full Report (PDF)",
-    data=pdf_data,
-    file_name="skillgap_report.pdf",
-    mime="application/pdf"
-)
+@st.cache_data(max_entries=32, show_spinner=False)
+def generate_pdf(overall_match, matched, missing, skills):
+    # Cached by report content, so reruns with the same data reuse the bytes
+    return report.generate_pdf(overall_match, matched, missing, skills)
+
+
+# Only build the report once the user asks for it
+if st.button("📄 Prepare Full Report (PDF)"):
+    st.session_state["pdf_requested"] = True
+
+if st.session_state.get("pdf_requested"):
+    report_rows = tuple(zip(
+        skills_df["Skill"],
+        skills_df["Resume Score"],
+        skills_df["Job Requirement Score"],
+    ))
+    pdf_data = generate_pdf(overall_match, matched, missing, report_rows)
+
+    st.download_button(
+        label="📄 Download Full Report (PDF)",
+        data=pdf_data,
+        file_name="skillgap_report.pdf",
+        mime="application/pdf"
+    )
 
 # Footer
 st.markdown("---")
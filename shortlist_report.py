@@ -0,0 +1,57 @@
+# ----------------------------------------------------------
+# SkillGapAI - Recall report for the embedding label shortlist
+# ----------------------------------------------------------
+# Compares zero-shot skill labels with and without the prefilter:
+#
+#   python shortlist_report.py resume.txt jd.txt --k 5 10 20
+
+import argparse
+import json
+
+from skillgap import extractor
+
+
+def zero_shot_labels(text, candidate_labels):
+    output, _ = extractor.chunked_zero_shot(text, candidate_labels)
+    return extractor.bert_skills(output)
+
+
+def recall_report(texts, ks):
+    """Per-k recall of the labels the full zero-shot pass accepts"""
+    all_labels = extractor.all_skill_labels()
+    baseline = [zero_shot_labels(text, all_labels) for text in texts]
+    expected = sum(len(labels) for labels in baseline)
+
+    report = {"documents": len(texts), "labels": len(all_labels), "baseline_hits": expected, "k": {}}
+    for k in ks:
+        shortlists = extractor.shortlist_labels(texts, k)
+        in_shortlist = 0
+        kept = 0
+        for text, labels, full in zip(texts, shortlists, baseline):
+            in_shortlist += len(full & set(labels))
+            kept += len(full & zero_shot_labels(text, labels))
+        report["k"][k] = {
+            # share of baseline labels that survive the prefilter at all
+            "shortlist_recall": in_shortlist / expected if expected else 1.0,
+            # share of baseline labels still accepted after scoring the shortlist
+            "end_to_end_recall": kept / expected if expected else 1.0,
+        }
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Shortlist recall report")
+    parser.add_argument("files", nargs="*", default=["resume.txt", "jd.txt"])
+    parser.add_argument("--k", type=int, nargs="+", default=[5, 10, extractor.SHORTLIST_K])
+    args = parser.parse_args()
+
+    texts = []
+    for path in args.files:
+        with open(path, "r", encoding="utf-8") as f:
+            texts.append(f.read())
+
+    print(json.dumps(recall_report(texts, args.k), indent=2))
+
+
+if __name__ == "__main__":
+    main()
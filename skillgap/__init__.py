@@ -0,0 +1,23 @@
+"""SkillGapAI core library.
+
+Plain functions and classes shared by the Streamlit milestone apps, the
+FastAPI service and the batch tools. Importing the package has no side
+effects: models load lazily in ``skillgap.extractor`` and the heavier
+modules (``parsing``, ``similarity``, ``embedding_store``, ``ann_index``)
+are imported on demand.
+"""
+
+from .analysis import categorized_skills, highlight_html, skill_confidences, skill_gap
+from .matcher import Match, SkillMatcher
+from .text import clean_text, normalize_skill
+
+__all__ = [
+    "Match",
+    "SkillMatcher",
+    "categorized_skills",
+    "clean_text",
+    "highlight_html",
+    "normalize_skill",
+    "skill_confidences",
+    "skill_gap",
+]
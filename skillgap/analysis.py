@@ -0,0 +1,40 @@
+def categorized_skills(matcher, text):
+    """Distinct skills found in text grouped by category, in order of first occurrence"""
+    found = {}
+    for m in matcher.find_longest(text):
+        found.setdefault(m.category, {}).setdefault(m.skill, None)
+    return {category: list(skills) for category, skills in found.items()}
+
+
+def highlight_html(matcher, text, skills):
+    """Wrap each occurrence of skills in a highlight span, in a single pass"""
+    parts = []
+    pos = 0
+    for m in matcher.find_longest(text, skills):
+        parts.append(text[pos:m.start])
+        parts.append(f"<span class='highlight'>{text[m.start:m.end]}</span>")
+        pos = m.end
+    parts.append(text[pos:])
+    return "".join(parts).replace("\n", "<br>")
+
+
+def skill_confidences(skills):
+    n = len(skills)
+    if n == 0:
+        return {}
+    start = 96
+    step = 10 / max(n - 1, 1)
+    conf = {}
+    for i, s in enumerate(skills):
+        conf[s] = max(75, round(start - i * step))
+    return conf
+
+
+def skill_gap(resume_skills, jd_skills):
+    """Skills in both documents, missing from the resume, and extra in the resume"""
+    resume_skills, jd_skills = set(resume_skills), set(jd_skills)
+    return (
+        sorted(resume_skills & jd_skills),
+        sorted(jd_skills - resume_skills),
+        sorted(resume_skills - jd_skills),
+    )
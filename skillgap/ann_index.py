@@ -0,0 +1,144 @@
+# ----------------------------------------------------------
+# SkillGapAI - Approximate nearest-neighbour skill index
+# ----------------------------------------------------------
+# Inverted-file (IVF) index over normalized taxonomy embeddings. Vectors
+# are clustered with spherical k-means; a query only scores the vectors
+# in its ``nprobe`` closest clusters. Raise ``nprobe`` for recall, lower
+# it for latency (nprobe == n_lists is exact search).
+#
+# Build one from the embedding store with:
+#
+#   python -m skillgap.ann_index --out .ann_index
+
+import json
+import os
+
+import numpy as np
+
+from .similarity import normalize_rows, top_k_similar
+
+
+def _kmeans(vectors, n_lists, n_iter, rng):
+    centroids = vectors[rng.choice(len(vectors), n_lists, replace=False)]
+    for _ in range(n_iter):
+        assign = top_k_similar(vectors, centroids, k=1, normalized=True)[1][:, 0]
+        sums = np.zeros_like(centroids)
+        np.add.at(sums, assign, vectors)
+        counts = np.bincount(assign, minlength=n_lists)
+
+        # Re-seed empty clusters from random points
+        empty = counts == 0
+        if empty.any():
+            sums[empty] = vectors[rng.choice(len(vectors), int(empty.sum()), replace=False)]
+        centroids = normalize_rows(sums)
+    return centroids
+
+
+class IVFIndex:
+    """CPU-only IVF index mapping free-text skill embeddings onto a taxonomy."""
+
+    def __init__(self, centroids, vectors, ids, offsets, labels, nprobe=8):
+        self.centroids = centroids
+        self.vectors = vectors      # taxonomy vectors grouped by list
+        self.ids = ids              # original row of each grouped vector
+        self.offsets = offsets      # list i spans vectors[offsets[i]:offsets[i + 1]]
+        self.labels = labels
+        self.nprobe = nprobe
+
+    def __len__(self):
+        return len(self.ids)
+
+    @property
+    def n_lists(self):
+        return len(self.centroids)
+
+    @classmethod
+    def build(cls, embeddings, labels, n_lists=None, n_iter=10, train_size=None, nprobe=8, seed=0):
+        vectors = normalize_rows(embeddings)
+        n = len(vectors)
+        n_lists = min(n, n_lists or max(1, 4 * int(np.sqrt(n))))
+        rng = np.random.default_rng(seed)
+
+        # k-means only needs a sample of the taxonomy to place centroids
+        train_size = min(n, train_size or 64 * n_lists)
+        train = vectors[rng.choice(n, train_size, replace=False)] if train_size < n else vectors
+        centroids = _kmeans(train, n_lists, n_iter, rng)
+
+        assign = top_k_similar(vectors, centroids, k=1, normalized=True)[1][:, 0]
+        order = np.argsort(assign, kind="stable")
+        offsets = np.concatenate([[0], np.cumsum(np.bincount(assign, minlength=n_lists))])
+        return cls(centroids, vectors[order], order, offsets, list(labels), nprobe=nprobe)
+
+    def search(self, queries, k=5, nprobe=None):
+        """Approximate top-k taxonomy rows per query: ``(scores, indices)``"""
+        nprobe = min(nprobe or self.nprobe, self.n_lists)
+        queries = normalize_rows(queries)
+        probes = top_k_similar(queries, self.centroids, k=nprobe, normalized=True)[1]
+
+        scores = np.full((len(queries), k), -np.inf, dtype=np.float32)
+        indices = np.full((len(queries), k), -1, dtype=np.int64)
+        for q, lists in enumerate(probes):
+            rows = np.concatenate([np.arange(self.offsets[i], self.offsets[i + 1]) for i in lists])
+            if not len(rows):
+                continue
+            sims = self.vectors[rows] @ queries[q]
+            kk = min(k, len(rows))
+            top = np.argpartition(-sims, kk - 1)[:kk]
+            top = top[np.argsort(-sims[top])]
+            scores[q, :kk] = sims[top]
+            indices[q, :kk] = self.ids[rows[top]]
+        return scores, indices
+
+    def lookup(self, queries, nprobe=None):
+        """Best taxonomy label and score for each query embedding"""
+        scores, indices = self.search(queries, k=1, nprobe=nprobe)
+        return [
+            (self.labels[i] if i >= 0 else None, float(s))
+            for s, i in zip(scores[:, 0], indices[:, 0])
+        ]
+
+    def save(self, directory):
+        os.makedirs(directory, exist_ok=True)
+        np.save(os.path.join(directory, "centroids.npy"), self.centroids)
+        np.save(os.path.join(directory, "vectors.npy"), self.vectors)
+        np.save(os.path.join(directory, "ids.npy"), self.ids)
+        np.save(os.path.join(directory, "offsets.npy"), self.offsets)
+        with open(os.path.join(directory, "labels.json"), "w", encoding="utf-8") as f:
+            json.dump({"nprobe": self.nprobe, "labels": self.labels}, f)
+
+    @classmethod
+    def load(cls, directory, mmap=True):
+        mode = "r" if mmap else None
+        with open(os.path.join(directory, "labels.json"), "r", encoding="utf-8") as f:
+            meta = json.load(f)
+        return cls(
+            np.load(os.path.join(directory, "centroids.npy")),
+            np.load(os.path.join(directory, "vectors.npy"), mmap_mode=mode),
+            np.load(os.path.join(directory, "ids.npy"), mmap_mode=mode),
+            np.load(os.path.join(directory, "offsets.npy")),
+            meta["labels"],
+            nprobe=meta["nprobe"],
+        )
+
+
+def main():
+    import argparse
+
+    from .embedding_store import DEFAULT_DIRECTORY, DEFAULT_MODEL, EmbeddingStore
+
+    parser = argparse.ArgumentParser(description="Build an IVF index from the embedding store")
+    parser.add_argument("--store", default=DEFAULT_DIRECTORY)
+    parser.add_argument("--model", default=DEFAULT_MODEL)
+    parser.add_argument("--out", default=".ann_index")
+    parser.add_argument("--n-lists", type=int, default=None)
+    parser.add_argument("--nprobe", type=int, default=8)
+    args = parser.parse_args()
+
+    store = EmbeddingStore(args.store, args.model)
+    index = IVFIndex.build(store.vectors(), store.skills(), n_lists=args.n_lists, nprobe=args.nprobe)
+    index.save(args.out)
+    print(f"Indexed {len(index)} skills into {index.n_lists} lists at {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+# ----------------------------------------------------------
+# SkillGapAI - Cheap-first extraction cascade
+# ----------------------------------------------------------
+# Skills are decided by the cheapest tier that can decide them:
+#
+#   match      exact or alias match of a taxonomy skill in the text
+#   embedding  window/label cosine similarity: clearly present labels are
+#              accepted, clearly absent ones dropped
+#   zero_shot  the zero-shot model, only for the ambiguous labels left over
+#
+# Each document has a latency budget (SKILLGAP_BUDGET_MS or per request,
+# 0 = none). The shared match and embedding tiers count against every
+# document in the batch; the zero-shot tier runs one document at a time
+# and each gets what is left of its own budget from when its turn starts.
+# Once a budget is spent, no further tier starts for that document and
+# the labels still open are returned as "undecided" rather than guessed.
+
+import os
+import time
+
+from . import extractor
+from .metrics import CASCADE_DEPTH, LABELS_SCORED, stage
+
+# Cosine similarity (best window vs label) at or above which a label is accepted
+EMBED_ACCEPT = float(os.environ.get("SKILLGAP_EMBED_ACCEPT", "0.6"))
+# Below this a label is dropped without asking the zero-shot model
+EMBED_REJECT = float(os.environ.get("SKILLGAP_EMBED_REJECT", "0.3"))
+BUDGET_MS = float(os.environ.get("SKILLGAP_BUDGET_MS", "0"))
+
+
+def _result(decided, undecided=(), exhausted=False):
+    return {
+        "skills": sorted(decided),
+        "decided_by": decided,
+        "undecided": list(undecided),
+        "budget_exhausted": exhausted,
+    }
+
+
+def extract_skills_cascade(text, budget_ms=None, shortlist_k=None):
+    """Skills for one text with the tier that decided each; see extract_skills_cascade_batch"""
+    return extract_skills_cascade_batch([text], budget_ms=budget_ms, shortlist_k=shortlist_k)[0]
+
+
+def extract_skills_cascade_batch(texts, budget_ms=None, shortlist_k=None, batch_size=32):
+    """Run the cascade over texts; returns one dict per text, in input order.
+
+    Each dict has "skills", "decided_by" ({skill: tier}), "undecided"
+    (ambiguous labels the budget did not leave time to score) and
+    "budget_exhausted". budget_ms is one budget for every text or a
+    sequence with one per text (None means BUDGET_MS). At most
+    shortlist_k ambiguous labels (default SHORTLIST_K) per text go to the
+    zero-shot model.
+    """
+    import numpy as np
+
+    texts = list(texts)
+    if not texts:
+        return []
+    if budget_ms is None or isinstance(budget_ms, (int, float)):
+        budget_ms = [budget_ms] * len(texts)
+    budgets = [(BUDGET_MS if b is None else b) / 1000 for b in budget_ms]
+    start = time.monotonic()
+    shortlist_k = extractor.SHORTLIST_K if shortlist_k is None else shortlist_k
+    taxonomy = extractor.get_taxonomy()   # one snapshot for the whole batch
+    lengths = [len(text) for text in texts]
+
+    def out_of_time(i, spent):
+        return budgets[i] > 0 and spent >= budgets[i]
+
+    # Tier 1: exact and alias matches
+    with stage("cascade_match", lengths):
+        decided = [dict.fromkeys(taxonomy.matcher.find_skills(text), "match") for text in texts]
+    results = [None] * len(texts)
+    spent = time.monotonic() - start
+    for i in range(len(texts)):
+        if out_of_time(i, spent):
+            CASCADE_DEPTH.inc(tier="match")
+            results[i] = _result(decided[i], exhausted=True)
+    todo = [i for i, result in enumerate(results) if result is None]
+    if not todo:
+        return results
+
+    # Tier 2: best window-vs-label similarity for every label not matched yet
+    with stage("cascade_embedding", [lengths[i] for i in todo]):
+        scores = extractor.window_label_scores([texts[i] for i in todo], taxonomy)
+
+        ambiguous = {}
+        for i, best in zip(todo, scores):
+            found = decided[i]
+            open_labels = []
+            for j in np.argsort(-best):
+                label = taxonomy.labels[j]
+                if best[j] < EMBED_REJECT:
+                    break
+                if label in found:
+                    continue
+                if best[j] >= EMBED_ACCEPT:
+                    found[label] = "embedding"
+                else:
+                    open_labels.append(label)
+            ambiguous[i] = open_labels[:shortlist_k] if shortlist_k > 0 else open_labels
+
+    # Tier 3: zero-shot scoring of the ambiguous labels only. Texts take turns,
+    # so each deadline starts when its turn does, less the shared tiers' time
+    spent = time.monotonic() - start
+    for i in todo:
+        found, labels = decided[i], ambiguous[i]
+        if not labels or out_of_time(i, spent):
+            CASCADE_DEPTH.inc(tier="embedding")
+            results[i] = _result(found, labels, exhausted=bool(labels))
+            continue
+        deadline = time.monotonic() + budgets[i] - spent if budgets[i] > 0 else None
+        with stage("zero_shot", [lengths[i]]):
+            output, scored = extractor.chunked_zero_shot(texts[i], labels, batch_size, deadline)
+        LABELS_SCORED.inc(scored)
+        CASCADE_DEPTH.inc(tier="zero_shot")
+        for label in extractor.bert_skills(output):
+            found.setdefault(label, "zero_shot")
+        undecided = output.get("undecided", [])
+        results[i] = _result(found, undecided, exhausted=bool(undecided))
+    return results
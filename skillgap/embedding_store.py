@@ -0,0 +1,147 @@
+# ----------------------------------------------------------
+# SkillGapAI - Persistent skill-embedding store
+# ----------------------------------------------------------
+# Skill strings are encoded once per model and kept on disk as a
+# memory-mapped matrix plus a line-per-row index:
+#
+#   <directory>/<model>/meta.json     model name, dimension, dtype
+#   <directory>/<model>/index.txt     one normalized skill per row
+#   <directory>/<model>/vectors.bin   raw row-major matrix
+#
+# Precompute the whole taxonomy at build time with:
+#
+#   python -m skillgap.embedding_store --skills skills.json
+
+import argparse
+import json
+import os
+import threading
+
+import numpy as np
+
+from .taxonomy import load_taxonomy
+
+from .text import normalize_skill
+
+DEFAULT_DIRECTORY = os.environ.get("SKILLGAP_EMBEDDING_DIR", ".embeddings")
+DEFAULT_MODEL = "all-MiniLM-L6-v2"
+
+
+class EmbeddingStore:
+    """Append-only, memory-mapped embedding cache for one model."""
+
+    def __init__(self, directory=DEFAULT_DIRECTORY, model_name=DEFAULT_MODEL, dtype="float32"):
+        self.model_name = model_name
+        self.path = os.path.join(directory, model_name.replace("/", "__"))
+        self._lock = threading.Lock()
+        os.makedirs(self.path, exist_ok=True)
+
+        meta_path = os.path.join(self.path, "meta.json")
+        if os.path.exists(meta_path):
+            with open(meta_path, "r") as f:
+                meta = json.load(f)
+            if meta["model"] != model_name:
+                raise ValueError(f"Store at {self.path} belongs to model {meta['model']!r}")
+            self.dtype = np.dtype(meta["dtype"])
+            self.dim = meta["dim"]
+        else:
+            self.dtype = np.dtype(dtype)
+            self.dim = None
+
+        self._rows = {}
+        index_path = os.path.join(self.path, "index.txt")
+        if os.path.exists(index_path):
+            with open(index_path, "r", encoding="utf-8") as f:
+                for line in f:
+                    self._rows[line.rstrip("\n")] = len(self._rows)
+        self._truncate_partial_write()
+        self._vectors = self._open_vectors()
+
+    def __len__(self):
+        return len(self._rows)
+
+    def __contains__(self, skill):
+        return normalize_skill(skill) in self._rows
+
+    def skills(self):
+        """Stored skill strings in row order"""
+        return list(self._rows)
+
+    def vectors(self):
+        """Memory-mapped ``(len(self), dim)`` matrix of stored embeddings"""
+        if self._vectors is None:
+            return np.zeros((0, self.dim or 0), dtype=self.dtype)
+        return self._vectors
+
+    def _truncate_partial_write(self):
+        vectors_path = os.path.join(self.path, "vectors.bin")
+        if self.dim is None or not os.path.exists(vectors_path):
+            return
+        expected = len(self._rows) * self.dim * self.dtype.itemsize
+        if os.path.getsize(vectors_path) > expected:
+            with open(vectors_path, "r+b") as f:
+                f.truncate(expected)
+
+    def _open_vectors(self):
+        if not self._rows:
+            return None
+        return np.memmap(
+            os.path.join(self.path, "vectors.bin"),
+            dtype=self.dtype,
+            mode="r",
+            shape=(len(self._rows), self.dim),
+        )
+
+    def _append(self, keys, embeddings):
+        embeddings = np.asarray(embeddings)
+        if self.dim is None:
+            self.dim = int(embeddings.shape[1])
+            with open(os.path.join(self.path, "meta.json"), "w") as f:
+                json.dump({"model": self.model_name, "dim": self.dim, "dtype": self.dtype.name}, f)
+
+        # Vectors first, then the index: a crash leaves unused bytes, never missing rows
+        with open(os.path.join(self.path, "vectors.bin"), "ab") as f:
+            f.write(np.ascontiguousarray(embeddings, dtype=self.dtype).tobytes())
+        with open(os.path.join(self.path, "index.txt"), "a", encoding="utf-8") as f:
+            for key in keys:
+                f.write(key + "\n")
+                self._rows[key] = len(self._rows)
+        self._vectors = self._open_vectors()
+
+    def encode(self, skills, model, batch_size=64):
+        """Embeddings for skills, encoding only strings not already stored"""
+        keys = [normalize_skill(s) for s in skills]
+        with self._lock:
+            missing = list(dict.fromkeys(k for k in keys if k not in self._rows))
+            if missing:
+                self._append(missing, model.encode(missing, batch_size=batch_size))
+            if not keys:
+                return np.zeros((0, self.dim or 0), dtype=np.float32)
+            return np.asarray(self._vectors[[self._rows[k] for k in keys]], dtype=np.float32)
+
+    def precompute(self, skills, model, batch_size=256):
+        """Encode a whole vocabulary ahead of time; returns the number of new rows"""
+        before = len(self)
+        self.encode(skills, model, batch_size=batch_size)
+        return len(self) - before
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Precompute skill embeddings")
+    parser.add_argument("--skills", default="skills.json", help="skills.json or a compiled skill index")
+    parser.add_argument("--directory", default=DEFAULT_DIRECTORY)
+    parser.add_argument("--model", default=DEFAULT_MODEL)
+    parser.add_argument("--dtype", choices=["float32", "float16"], default="float32")
+    args = parser.parse_args()
+
+    from sentence_transformers import SentenceTransformer
+
+    skills = load_taxonomy(args.skills).labels
+
+    store = EmbeddingStore(args.directory, args.model, args.dtype)
+    added = store.precompute(skills, SentenceTransformer(args.model))
+    print(f"{added} new embeddings, {len(store)} total in {store.path}")
+
+
+if __name__ == "__main__":
+    main()
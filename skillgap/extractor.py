@@ -0,0 +1,357 @@
+import os
+import threading
+import time
+from bisect import bisect_right
+
+from .metrics import LABELS_SCORED, stage
+from .taxonomy import load_taxonomy
+from .text import split_windows
+from .zero_shot import load_classifier
+
+SPACY_MODEL = "en_core_web_sm"
+# skills.json or a compiled index from `python -m skillgap.taxonomy`
+SKILLS_PATH = os.environ.get(
+    "SKILLGAP_SKILLS_PATH",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "skills.json"),
+)
+BERT_MODEL = "facebook/bart-large-mnli"
+# Zero-shot backend: torch (fp32), int8 or onnx; see skillgap/zero_shot.py
+ZERO_SHOT_BACKEND = os.environ.get("SKILLGAP_ZERO_SHOT_BACKEND", "torch")
+ZERO_SHOT_MODEL_DIR = os.environ.get("SKILLGAP_ZERO_SHOT_MODEL_DIR")
+EMBEDDING_MODEL = "all-MiniLM-L6-v2"
+
+# Number of skill labels kept by the embedding prefilter (0 sends every label)
+SHORTLIST_K = int(os.environ.get("SKILLGAP_SHORTLIST_K", "20"))
+
+# Zero-shot scoring is multi-label: each label gets its own entailment
+# probability, so long and short texts are scored the same way and a text
+# can support several skills. This is the probability needed to report one;
+# check a different value with shortlist_report.py before changing it.
+CONFIDENCE_THRESHOLD = float(os.environ.get("SKILLGAP_ZERO_SHOT_THRESHOLD", "0.5"))
+
+# Longer texts are scored by the zero-shot model in windows of this many
+# characters, since BART truncates its input at 1024 tokens
+CHUNK_CHARS = int(os.environ.get("SKILLGAP_CHUNK_CHARS", "2000"))
+
+# The embedding model truncates at 256 word pieces, so documents are embedded
+# in windows of about that size and each label keeps its best window score
+EMBED_WINDOW_CHARS = int(os.environ.get("SKILLGAP_EMBED_WINDOW_CHARS", "1000"))
+
+# Models are loaded on first use (or by warm_up) instead of at import time
+_models = {}
+_lock = threading.RLock()
+_ready = threading.Event()
+
+
+def _load(name, loader):
+    model = _models.get(name)
+    if model is None:
+        with _lock:
+            model = _models.get(name)
+            if model is None:
+                model = _models[name] = loader()
+    return model
+
+
+def _load_nlp():
+    import spacy
+    return spacy.load(SPACY_MODEL)
+
+
+def _load_bert_classifier():
+    return load_classifier(ZERO_SHOT_BACKEND, ZERO_SHOT_MODEL_DIR, model=BERT_MODEL)
+
+
+def _load_embedder():
+    from sentence_transformers import SentenceTransformer
+    return SentenceTransformer(EMBEDDING_MODEL)
+
+
+def _label_embeddings(taxonomy, embedder):
+    """Normalized embeddings of taxonomy.labels, cached on the snapshot per embedder"""
+    key = ("label_embeddings", id(embedder))
+    embeddings = taxonomy.cache.get(key)
+    if embeddings is None:
+        with taxonomy.cache_lock:
+            embeddings = taxonomy.cache.get(key)
+            if embeddings is None:
+                embeddings = taxonomy.cache[key] = embedder.encode(
+                    taxonomy.labels, normalize_embeddings=True
+                )
+    return embeddings
+
+
+def watch_taxonomy(interval, stop):
+    """Reload the taxonomy whenever SKILLS_PATH changes, checking every interval seconds until stop is set"""
+    path = SKILLS_PATH
+    mtime = os.path.getmtime(path)
+    while not stop.wait(interval):
+        try:
+            current = os.path.getmtime(path)
+            if current != mtime:
+                mtime = current
+                reload_taxonomy(path)
+        except Exception:
+            # Keep serving the current snapshot; a half-written file is retried next poll
+            mtime = None
+
+
+def get_nlp():
+    """spaCy model"""
+    return _load("nlp", _load_nlp)
+
+
+def get_taxonomy():
+    """Current skill taxonomy snapshot (skills, aliases and compiled matcher)"""
+    return _load("taxonomy", lambda: load_taxonomy(SKILLS_PATH))
+
+
+def get_skill_db():
+    """Skills database as {category: [skill, ...]}"""
+    return get_taxonomy().skill_db
+
+
+def skill_db_version():
+    """Taxonomy version (declared version plus content hash), used to key cached results"""
+    return get_taxonomy().version
+
+
+def get_skill_matcher():
+    """Skills database compiled into a single-pass matcher"""
+    return get_taxonomy().matcher
+
+
+def get_bert_classifier():
+    """BERT zero-shot classifier on the configured backend"""
+    return _load("bert_classifier", _load_bert_classifier)
+
+
+def get_embedder():
+    """Sentence embedding model used to shortlist skill labels"""
+    return _load("embedder", _load_embedder)
+
+
+def get_label_embeddings(taxonomy=None):
+    """Precomputed, normalized embedding matrix for all_skill_labels()"""
+    return _label_embeddings(taxonomy or get_taxonomy(), get_embedder())
+
+
+def reload_taxonomy(path=None):
+    """Load the taxonomy again and swap it in atomically; returns the new snapshot.
+
+    The new snapshot is fully built (and its label embeddings computed, if
+    the embedder is loaded) before the swap, so requests never wait on it
+    and in-flight requests finish on the snapshot they started with.
+    """
+    taxonomy = load_taxonomy(path or SKILLS_PATH)
+    embedder = _models.get("embedder")
+    if embedder is not None:
+        _label_embeddings(taxonomy, embedder)
+    set_models(taxonomy=taxonomy)
+    return taxonomy
+
+
+def set_models(**models):
+    """Install preloaded models (or offline stand-ins) instead of loading them"""
+    with _lock:
+        _models.update(models)
+
+
+def warm_up():
+    """Load every model and run one dummy inference so the first request is fast"""
+    extract_skills("Python developer with strong communication skills.")
+    _ready.set()
+
+
+def is_ready():
+    return _ready.is_set()
+
+
+def noun_chunk_skills(doc, matcher=None):
+    """Skills from the doc's longest non-overlapping matches, kept if inside a noun chunk"""
+    chunks = [(chunk.start_char, chunk.end_char) for chunk in doc.noun_chunks]
+    starts = [start for start, _ in chunks]
+
+    found = set()
+    for m in (matcher or get_skill_matcher()).find_longest(doc.text):
+        i = bisect_right(starts, m.start) - 1
+        if i >= 0 and m.end <= chunks[i][1]:
+            found.add(m.skill)
+    return found
+
+
+def bert_skills(bert_output):
+    """Labels the zero-shot classifier scored above the confidence threshold"""
+    return {
+        label
+        for label, score in zip(bert_output["labels"], bert_output["scores"])
+        if score > CONFIDENCE_THRESHOLD
+    }
+
+
+def chunked_zero_shot(text, labels, batch_size=8, deadline=None):
+    """Zero-shot output for a text, scored window by window.
+
+    A text that fits in CHUNK_CHARS is a single window. Windows are scored
+    in batches, and each label keeps its best score over all windows.
+    A label that passes the threshold is decided and not scored again, so
+    the remaining windows only pay for undecided labels. Past ``deadline``
+    (a time.monotonic() value) no further batches are scored and the
+    labels still open are listed under "undecided".
+    Returns (output, number of label scores computed).
+    """
+    classifier = get_bert_classifier()
+    windows = split_windows(text, CHUNK_CHARS)
+    best = dict.fromkeys(labels, 0.0)
+    remaining = list(labels)
+    scored = 0
+
+    undecided = []
+    for i in range(0, len(windows), batch_size):
+        if not remaining:
+            break
+        if deadline is not None and time.monotonic() > deadline:
+            undecided = remaining
+            break
+        batch = windows[i:i + batch_size]
+        outputs = classifier(batch, candidate_labels=remaining, multi_label=True, batch_size=batch_size)
+        if isinstance(outputs, dict):
+            outputs = [outputs]
+        scored += len(batch) * len(remaining)
+        for output in outputs:
+            for label, score in zip(output["labels"], output["scores"]):
+                best[label] = max(best[label], score)
+        remaining = [label for label in remaining if best[label] <= CONFIDENCE_THRESHOLD]
+
+    ranked = sorted(best, key=best.get, reverse=True)
+    output = {"sequence": text, "labels": ranked, "scores": [best[label] for label in ranked]}
+    if undecided:
+        output["undecided"] = undecided
+    return output, scored
+
+
+def all_skill_labels(taxonomy=None):
+    return (taxonomy or get_taxonomy()).labels
+
+
+def window_label_scores(texts, taxonomy=None):
+    """(texts x labels) matrix of the best window-vs-label cosine similarity per text"""
+    import numpy as np
+
+    taxonomy = taxonomy or get_taxonomy()
+    embedder = get_embedder()
+    windows = [split_windows(text, EMBED_WINDOW_CHARS) or [text] for text in texts]
+    # One encode call for every window of every text
+    embeddings = embedder.encode([w for ws in windows for w in ws], normalize_embeddings=True)
+    scores = embeddings @ _label_embeddings(taxonomy, embedder).T
+
+    best = np.empty((len(texts), len(taxonomy.labels)), dtype=scores.dtype)
+    row = 0
+    for i, ws in enumerate(windows):
+        best[i] = scores[row:row + len(ws)].max(axis=0)
+        row += len(ws)
+    return best
+
+
+def shortlist_labels(texts, k=None, taxonomy=None):
+    """Top-k skill labels per text by embedding similarity, best first"""
+    import numpy as np
+
+    taxonomy = taxonomy or get_taxonomy()
+    labels = taxonomy.labels
+    k = SHORTLIST_K if k is None else k
+    if k <= 0 or k >= len(labels):
+        return [labels for _ in texts]
+
+    scores = window_label_scores(list(texts), taxonomy)
+
+    shortlists = []
+    for row in scores:
+        top = np.argpartition(-row, k - 1)[:k]
+        top = top[np.argsort(-row[top])]
+        shortlists.append([labels[i] for i in top])
+    return shortlists
+
+
+def group_by_labels(shortlists):
+    """Group shortlist indices whose shortlists hold the same labels: [(indices, labels), ...].
+
+    Zero-shot cost is per (document, label) pair, so documents are only
+    merged into one call when that adds no labels to any of them; with the
+    prefilter off the whole batch is one call.
+    """
+    groups = {}
+    for i, labels in enumerate(shortlists):
+        groups.setdefault(frozenset(labels), (list(labels), []))[1].append(i)
+    return [(indices, labels) for labels, indices in groups.values()]
+
+
+def extract_skills(text, shortlist_k=None):
+    taxonomy = get_taxonomy()   # one snapshot for the whole request
+    extracted = set()
+    lengths = [len(text)]
+    with stage("spacy_parse", lengths):
+        doc = get_nlp()(text)
+
+    # spaCy noun-chunk matching
+    with stage("noun_chunk_match", lengths):
+        extracted.update(noun_chunk_skills(doc, taxonomy.matcher))
+
+    # BERT classification scoring over the embedding shortlist
+    with stage("label_shortlist", lengths):
+        candidate_labels = shortlist_labels([text], shortlist_k, taxonomy)[0]
+    with stage("zero_shot", lengths):
+        bert_output, scored = chunked_zero_shot(text, candidate_labels)
+    LABELS_SCORED.inc(scored)
+    extracted.update(bert_skills(bert_output))
+
+    return list(extracted)
+
+
+def extract_skills_batch(texts, batch_size=32, shortlist_k=None):
+    """Extract skills for many texts at once, returned in input order"""
+    texts = list(texts)
+    if not texts:
+        return []
+
+    taxonomy = get_taxonomy()   # one snapshot for the whole batch
+    lengths = [len(text) for text in texts]
+
+    # spaCy noun-chunk matching, batched through nlp.pipe
+    with stage("spacy_parse", lengths):
+        docs = list(get_nlp().pipe(texts, batch_size=batch_size))
+    with stage("noun_chunk_match", lengths):
+        results = [noun_chunk_skills(doc, taxonomy.matcher) for doc in docs]
+
+    # BERT classification scoring, batched through the pipeline
+    with stage("label_shortlist", lengths):
+        shortlists = shortlist_labels(texts, shortlist_k, taxonomy)
+    with stage("zero_shot", lengths):
+        classifier = get_bert_classifier()
+        bert_outputs = [None] * len(texts)
+        short = [i for i, text in enumerate(texts) if len(text) <= CHUNK_CHARS]
+        scored = 0
+        # Each document is scored against its own shortlist only; documents
+        # with identical shortlists share one call
+        for group, labels in group_by_labels([shortlists[i] for i in short]):
+            outputs = classifier(
+                [texts[short[j]] for j in group], candidate_labels=labels,
+                multi_label=True, batch_size=batch_size,
+            )
+            if isinstance(outputs, dict):
+                outputs = [outputs]
+            scored += len(group) * len(labels)
+            for j, output in zip(group, outputs):
+                bert_outputs[short[j]] = output
+
+        # Long documents are scored in windows, skipping labels already decided
+        for i, text in enumerate(texts):
+            if bert_outputs[i] is None:
+                bert_outputs[i], n = chunked_zero_shot(text, shortlists[i], batch_size)
+                scored += n
+    LABELS_SCORED.inc(scored)
+
+    for extracted, bert_output in zip(results, bert_outputs):
+        extracted.update(bert_skills(bert_output))
+
+    return [list(extracted) for extracted in results]
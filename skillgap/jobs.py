@@ -0,0 +1,201 @@
+# ----------------------------------------------------------
+# SkillGapAI - Background extraction jobs
+# ----------------------------------------------------------
+# Uploaded documents are spooled to disk and processed by a fixed pool of
+# worker threads, so a long document never holds an HTTP request open.
+# The queue is bounded: when it is full, submit raises QueueFull with an
+# estimate of when to retry.
+
+import asyncio
+import os
+import queue
+import tempfile
+import threading
+import time
+import uuid
+
+CHUNK_SIZE = 1 << 20
+
+
+class JobTooLarge(ValueError):
+    pass
+
+
+class QueueFull(Exception):
+    def __init__(self, retry_after):
+        super().__init__(f"Job queue is full; retry in {retry_after} s")
+        self.retry_after = retry_after
+
+
+class JobQueue:
+    """Spooled, bounded job queue in front of a text -> result function.
+
+    ``process`` takes the extracted document text and returns a
+    JSON-serializable result. Finished jobs are kept for ``ttl`` seconds.
+    """
+
+    def __init__(self, process, spool_dir=None, workers=2, max_queued=32, ttl=3600, max_bytes=None):
+        self.process = process
+        self.spool_dir = spool_dir or os.path.join(tempfile.gettempdir(), "skillgap-jobs")
+        self.workers = workers
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._queue = queue.Queue(maxsize=max_queued)
+        self._jobs = {}
+        self._lock = threading.Lock()
+        self._changed = threading.Condition(self._lock)
+        self._waiters = {}   # job id -> [(event loop, asyncio.Event)] of async long-polls
+        self._threads = []
+        self._durations = []
+
+    def start(self):
+        os.makedirs(self.spool_dir, exist_ok=True)
+        while len(self._threads) < self.workers:
+            thread = threading.Thread(target=self._run, name=f"job-worker-{len(self._threads)}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def stop(self):
+        for _ in self._threads:
+            self._queue.put(None)
+        for thread in self._threads:
+            thread.join()
+        self._threads = []
+
+    def _retry_after(self):
+        """Seconds until a queue slot is likely to free up"""
+        with self._lock:
+            recent = self._durations[-20:]
+        mean = sum(recent) / len(recent) if recent else 5.0
+        return max(1, round(mean * self._queue.qsize() / max(self.workers, 1)))
+
+    def check_capacity(self):
+        """Raise QueueFull now, before the caller reads an upload it can't queue"""
+        if self._queue.full():
+            raise QueueFull(self._retry_after())
+
+    def submit(self, fileobj, name):
+        """Spool fileobj (a PDF, DOCX or TXT named name) to disk and queue it; returns the job id"""
+        self._expire()
+        self.check_capacity()
+
+        job_id = uuid.uuid4().hex
+        ext = os.path.splitext(name)[1].lower() or ".txt"
+        path = os.path.join(self.spool_dir, job_id + ext)
+        size = 0
+        with open(path, "wb") as f:
+            while chunk := fileobj.read(CHUNK_SIZE):
+                size += len(chunk)
+                if self.max_bytes is not None and size > self.max_bytes:
+                    break
+                f.write(chunk)
+        if self.max_bytes is not None and size > self.max_bytes:
+            os.remove(path)
+            raise JobTooLarge(f"Upload exceeds {self.max_bytes} bytes")
+
+        job = {"id": job_id, "name": name, "status": "queued", "created": time.time(), "path": path}
+        with self._lock:
+            self._jobs[job_id] = job
+        try:
+            self._queue.put_nowait(job_id)
+        except queue.Full:
+            # Another request took the last slot between the check and the put
+            with self._lock:
+                del self._jobs[job_id]
+            os.remove(path)
+            raise QueueFull(self._retry_after())
+        return job_id
+
+    def get(self, job_id, wait=0):
+        """Public view of a job (None if unknown), waiting up to wait seconds for it to finish"""
+        deadline = time.monotonic() + wait
+        with self._changed:
+            while True:
+                job = self._jobs.get(job_id)
+                if job is None:
+                    return None
+                remaining = deadline - time.monotonic()
+                if job["status"] in ("done", "failed") or remaining <= 0:
+                    return self._view(job)
+                self._changed.wait(remaining)
+
+    async def wait(self, job_id, timeout):
+        """Like get(job_id, timeout), but waits on the event loop instead of parking a thread"""
+        loop = asyncio.get_running_loop()
+        event = asyncio.Event()
+        waiter = (loop, event)
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None or job["status"] in ("done", "failed") or timeout <= 0:
+                return self._view(job)
+            self._waiters.setdefault(job_id, []).append(waiter)
+        try:
+            await asyncio.wait_for(event.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            with self._lock:
+                waiters = self._waiters.get(job_id, [])
+                if waiter in waiters:
+                    waiters.remove(waiter)
+                if not waiters:
+                    self._waiters.pop(job_id, None)
+        with self._lock:
+            return self._view(self._jobs.get(job_id))
+
+    @staticmethod
+    def _view(job):
+        return None if job is None else {k: v for k, v in job.items() if k != "path"}
+
+    def _update(self, job, **fields):
+        with self._changed:
+            job.update(fields)
+            self._changed.notify_all()
+            if job["status"] in ("done", "failed"):
+                for loop, event in self._waiters.pop(job["id"], []):
+                    loop.call_soon_threadsafe(event.set)
+
+    def _run(self):
+        while True:
+            job_id = self._queue.get()
+            if job_id is None:
+                return
+            with self._lock:
+                job = self._jobs.get(job_id)
+            if job is None:
+                continue
+
+            start = time.time()
+            self._update(job, status="running", started=start)
+            try:
+                from .parsing import extract_text
+                text = extract_text(job["path"], name=job["name"])
+                result = self.process(text)
+            except Exception as e:
+                self._update(job, status="failed", error=repr(e), finished=time.time())
+            else:
+                self._update(job, status="done", result=result, finished=time.time())
+            finally:
+                if os.path.exists(job["path"]):
+                    os.remove(job["path"])
+            with self._lock:
+                self._durations = self._durations[-19:] + [time.time() - start]
+
+    def _expire(self):
+        """Forget finished jobs older than ttl"""
+        cutoff = time.time() - self.ttl
+        with self._lock:
+            for job_id in [j for j, job in self._jobs.items() if job.get("finished", cutoff + 1) < cutoff]:
+                del self._jobs[job_id]
+
+    def stats(self):
+        with self._lock:
+            statuses = [job["status"] for job in self._jobs.values()]
+        return {
+            "queued": self._queue.qsize(),
+            "max_queued": self._queue.maxsize,
+            "workers": self.workers,
+            "running": statuses.count("running"),
+            "done": statuses.count("done"),
+            "failed": statuses.count("failed"),
+        }
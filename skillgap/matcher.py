@@ -0,0 +1,243 @@
+import json
+import mmap
+import struct
+from array import array
+from collections import deque, namedtuple
+
+# A single skill occurrence: character offsets into the scanned text
+Match = namedtuple("Match", ["start", "end", "skill", "category"])
+
+# Separators folded to a plain space (one char each, so offsets are unchanged)
+_SEPARATORS = str.maketrans({"-": " ", "\n": " ", "\r": " ", "\t": " "})
+
+# Compiled index layout: magic, header length, JSON header, then int32 arrays
+_MAGIC = b"SGMATCH1"
+_ARRAYS = (
+    "goto_offsets", "goto_chars", "goto_targets", "fail",
+    "out_offsets", "out_patterns", "pattern_skill", "pattern_length", "pattern_bounded",
+)
+
+
+def _fold(text):
+    """Lowercase text and treat hyphens/line breaks as spaces, keeping offsets valid"""
+    folded = text.lower()
+    if len(folded) != len(text):
+        folded = "".join(c if len(c.lower()) != 1 else c.lower() for c in text)
+    return folded.translate(_SEPARATORS)
+
+
+def _is_word_char(c):
+    return c.isalnum() or c == "_"
+
+
+class SkillMatcher:
+    """Aho-Corasick automaton over a skill database.
+
+    Built once from a ``{category: [skill, ...]}`` mapping (plus optional
+    ``{alias: skill}`` table) and then scans any text in a single pass.
+    Matching is case-insensitive and a skill only matches on word
+    boundaries, so "sql" is not found inside "nosql". An alias match is
+    reported under its canonical skill.
+
+    The automaton is stored as flat int32 arrays, so ``save`` writes it
+    as-is and ``load`` maps it back with mmap instead of rebuilding it.
+    """
+
+    def __init__(self, skill_db, aliases=None):
+        self._skills = []
+        self.skills = {}
+        goto, out = [{}], [[]]
+        patterns = []
+
+        def add(key, skill_index):
+            state = 0
+            for c in key:
+                nxt = goto[state].get(c)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[state][c] = nxt
+                    goto.append({})
+                    out.append([])
+                state = nxt
+            out[state].append(len(patterns))
+            patterns.append((skill_index, len(key), _is_word_char(key[0])))
+
+        canonical = {}
+        for category, skill_list in skill_db.items():
+            for skill in skill_list:
+                key = _fold(skill.strip())
+                if key and key not in self.skills:
+                    canonical[key] = len(self._skills)
+                    self.skills[key] = (skill.strip(), category)
+                    self._skills.append((skill.strip(), category))
+                    add(key, canonical[key])
+
+        for alias, skill in (aliases or {}).items():
+            key, target = _fold(alias.strip()), _fold(skill.strip())
+            if key and key not in self.skills and target in canonical:
+                self.skills[key] = self._skills[canonical[target]]
+                add(key, canonical[target])
+
+        self._freeze(goto, out, patterns)
+
+    def _freeze(self, goto, out, patterns):
+        """Compute failure links and pack the automaton into int32 arrays"""
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for c, nxt in goto[state].items():
+                queue.append(nxt)
+                f = fail[state]
+                while f and c not in goto[f]:
+                    f = fail[f]
+                fail[nxt] = goto[f].get(c, 0)
+                out[nxt] = out[nxt] + out[fail[nxt]]
+
+        a = {name: array("i") for name in _ARRAYS}
+        for state, edges in enumerate(goto):
+            a["goto_offsets"].append(len(a["goto_chars"]))
+            for c in sorted(edges):
+                a["goto_chars"].append(ord(c))
+                a["goto_targets"].append(edges[c])
+            a["out_offsets"].append(len(a["out_patterns"]))
+            a["out_patterns"].extend(out[state])
+        a["goto_offsets"].append(len(a["goto_chars"]))
+        a["out_offsets"].append(len(a["out_patterns"]))
+        a["fail"].extend(fail)
+        for skill_index, length, bounded in patterns:
+            a["pattern_skill"].append(skill_index)
+            a["pattern_length"].append(length)
+            a["pattern_bounded"].append(int(bounded))
+        self._set_arrays(a)
+
+    def _set_arrays(self, arrays):
+        for name in _ARRAYS:
+            setattr(self, "_" + name, arrays[name])
+        # Edge dicts and output lists are unpacked from the arrays the first
+        # time a state is visited, so loading stays cheap and scans stay fast
+        self._edges = [None] * len(arrays["fail"])
+        self._outs = [None] * len(arrays["fail"])
+
+    def save(self, path, metadata=None):
+        """Write the compiled automaton (and optional JSON metadata) to path"""
+        header = json.dumps({
+            "skills": self._skills,
+            "keys": list(self.skills),
+            "metadata": metadata or {},
+            "arrays": {name: len(getattr(self, "_" + name)) for name in _ARRAYS},
+        }).encode("utf-8")
+        header += b" " * (-len(header) % 4)
+        with open(path, "wb") as f:
+            f.write(_MAGIC + struct.pack("<Q", len(header)) + header)
+            for name in _ARRAYS:
+                data = getattr(self, "_" + name)
+                f.write(data.tobytes() if isinstance(data, array) else bytes(data))
+
+    @classmethod
+    def load(cls, path):
+        """Map a compiled automaton written by ``save``; returns (matcher, metadata)"""
+        with open(path, "rb") as f:
+            buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if buf[:8] != _MAGIC:
+            raise ValueError(f"{path} is not a compiled skill index")
+        (header_len,) = struct.unpack("<Q", buf[8:16])
+        header = json.loads(bytes(buf[16:16 + header_len]))
+
+        view = memoryview(buf)
+        pos = 16 + header_len
+        arrays = {}
+        for name in _ARRAYS:
+            n = header["arrays"][name]
+            arrays[name] = view[pos:pos + 4 * n].cast("i")
+            pos += 4 * n
+
+        matcher = cls.__new__(cls)
+        matcher._skills = [tuple(s) for s in header["skills"]]
+        matcher._mmap = buf
+        matcher._set_arrays(arrays)
+        matcher.skills = {}
+        for p, key in enumerate(header["keys"]):
+            matcher.skills[key] = matcher._skills[arrays["pattern_skill"][p]]
+        return matcher, header["metadata"]
+
+    def _unpack_edges(self, state):
+        lo, hi = self._goto_offsets[state], self._goto_offsets[state + 1]
+        edges = self._edges[state] = {
+            chr(self._goto_chars[i]): self._goto_targets[i] for i in range(lo, hi)
+        }
+        return edges
+
+    def _unpack_outs(self, state):
+        lo, hi = self._out_offsets[state], self._out_offsets[state + 1]
+        outs = self._outs[state] = tuple(
+            (self._pattern_length[p], self._pattern_bounded[p], self._skills[self._pattern_skill[p]])
+            for p in self._out_patterns[lo:hi]
+        )
+        return outs
+
+    def __len__(self):
+        return len(self.skills)
+
+    def __contains__(self, skill):
+        return _fold(skill.strip()) in self.skills
+
+    def finditer(self, text):
+        """Yield every word-bounded skill occurrence in text, in end order"""
+        folded = _fold(text)
+        edges, outs, fail = self._edges, self._outs, self._fail
+        n = len(folded)
+        state = 0
+
+        for i, c in enumerate(folded):
+            while True:
+                e = edges[state]
+                if e is None:
+                    e = self._unpack_edges(state)
+                nxt = e.get(c)
+                if nxt is not None or state == 0:
+                    break
+                state = fail[state]
+            state = nxt or 0
+
+            o = outs[state]
+            if o is None:
+                o = self._unpack_outs(state)
+            if not o:
+                continue
+            end = i + 1
+            if end < n and _is_word_char(folded[end]) and _is_word_char(c):
+                continue
+            for length, bounded, (skill, category) in o:
+                start = end - length
+                if start > 0 and bounded and _is_word_char(folded[start - 1]):
+                    continue
+                yield Match(start, end, skill, category)
+
+    def find_longest(self, text, skills=None):
+        """Leftmost-longest, non-overlapping matches, optionally limited to skills"""
+        if skills is not None:
+            wanted = {_fold(s.strip()) for s in skills}
+            matches = [m for m in self.finditer(text) if _fold(m.skill) in wanted]
+        else:
+            matches = list(self.finditer(text))
+        matches.sort(key=lambda m: (m.start, -m.end))
+
+        selected = []
+        last_end = 0
+        for m in matches:
+            if m.start >= last_end:
+                selected.append(m)
+                last_end = m.end
+        return selected
+
+    def find_skills(self, text):
+        """Distinct skills from the non-overlapping longest matches, in order of first occurrence.
+
+        A shorter skill or alias inside a longer match ("js" in "node.js")
+        is not reported separately.
+        """
+        found = {}
+        for m in self.find_longest(text):
+            found.setdefault(m.skill, m.category)
+        return list(found)
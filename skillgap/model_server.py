@@ -0,0 +1,262 @@
+# ----------------------------------------------------------
+# SkillGapAI - Shared model host for multi-worker deployments
+# ----------------------------------------------------------
+# Every API worker that imports the extractor loads its own copy of spaCy
+# and BART (~1.6 GB each). Instead, run one model host per node:
+#
+#   SKILLGAP_MODEL_SERVER=/tmp/skillgap.sock python -m skillgap.model_server
+#
+# and start the API workers with the same SKILLGAP_MODEL_SERVER. They then
+# send documents to the host over the local socket and never load models
+# themselves. The host batches documents from all workers together.
+#
+# SKILLGAP_MODEL_SERVER is a Unix socket path or host:port.
+#
+# Messages are pickled, so the connection is authenticated with a shared
+# key: SKILLGAP_MODEL_SERVER_KEY if set, otherwise a random key the host
+# writes to SKILLGAP_MODEL_SERVER_KEY_FILE (mode 0600) on first start.
+# Workers must run as the same user to read it.
+
+import argparse
+import os
+import secrets
+import stat
+import threading
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import Client, Listener
+
+from . import cascade, extractor, metrics
+from .scheduler import BatchScheduler
+
+MODEL_SERVER = os.environ.get("SKILLGAP_MODEL_SERVER", "")
+KEY_FILE = os.environ.get(
+    "SKILLGAP_MODEL_SERVER_KEY_FILE", os.path.join(os.path.expanduser("~"), ".skillgap", "model_server.key")
+)
+# "full" runs every stage on every document; "cascade" stops at the cheapest tier that decides
+PIPELINE = os.environ.get("SKILLGAP_PIPELINE", "full")
+
+
+def parse_address(address):
+    """"host:port" -> (host, port); anything else is a Unix socket path"""
+    host, sep, port = address.rpartition(":")
+    if sep and port.isdigit():
+        return (host or "127.0.0.1", int(port))
+    return address
+
+
+def load_authkey(create=False):
+    """Shared connection key; the host (create=True) generates the key file if needed"""
+    key = os.environ.get("SKILLGAP_MODEL_SERVER_KEY")
+    if key:
+        return key.encode("utf-8")
+
+    if create and not os.path.exists(KEY_FILE):
+        os.makedirs(os.path.dirname(KEY_FILE), mode=0o700, exist_ok=True)
+        try:
+            fd = os.open(KEY_FILE, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        except FileExistsError:
+            pass   # another host process created it first
+        else:
+            with os.fdopen(fd, "w") as f:
+                f.write(secrets.token_hex(32))
+    try:
+        info = os.stat(KEY_FILE)
+    except FileNotFoundError:
+        raise RuntimeError(
+            f"No model server key: set SKILLGAP_MODEL_SERVER_KEY or start the host to create {KEY_FILE}"
+        ) from None
+    # A key file someone else could read or have planted is not a secret
+    if info.st_uid != os.getuid() or info.st_mode & (stat.S_IRWXG | stat.S_IRWXO):
+        raise RuntimeError(f"{KEY_FILE} must be owned by this user and have mode 0600")
+    with open(KEY_FILE, "r") as f:
+        return f.read().strip().encode("utf-8")
+
+
+def result_version():
+    """Identifies what produced a result (taxonomy and pipeline), for cache keys"""
+    return f"{extractor.skill_db_version()}/{PIPELINE}"
+
+
+def taxonomy_info(taxonomy):
+    return {"version": taxonomy.version, "skills": len(taxonomy), "aliases": len(taxonomy.aliases)}
+
+
+def run_batch(items):
+    """Extract a batch of (text, budget_ms) items; each result is (result dict, stage timings of its batch).
+
+    budget_ms (None for the default) only applies to the cascade pipeline.
+    """
+    texts = [text for text, _ in items]
+    with metrics.capture_timings() as timings:
+        if PIPELINE == "cascade":
+            budgets = [budget_ms for _, budget_ms in items]
+            results = cascade.extract_skills_cascade_batch(texts, budget_ms=budgets, batch_size=len(texts))
+        else:
+            results = [{"skills": skills} for skills in extractor.extract_skills_batch(texts, batch_size=len(texts))]
+    return [(result, timings) for result in results]
+
+
+class ModelClient:
+    """Connection pool to a model host, safe to share between threads"""
+
+    def __init__(self, address=MODEL_SERVER, authkey=None):
+        self.address = parse_address(address)
+        # Loaded on first connect: API workers may start before the host has created the key file
+        self.authkey = authkey
+        self._idle = []
+        self._lock = threading.Lock()
+
+    def _call(self, op, payload=None):
+        with self._lock:
+            conn = self._idle.pop() if self._idle else None
+        try:
+            status, result = self._send(conn, op, payload)
+        except (OSError, EOFError):
+            if conn is None:
+                raise
+            # Pooled connection went stale (e.g. the host restarted); retry once on a fresh one
+            status, result = self._send(None, op, payload)
+        if status == "error":
+            raise RuntimeError(f"model server: {result}")
+        return result
+
+    def _send(self, conn, op, payload):
+        try:
+            if conn is None:
+                if self.authkey is None:
+                    self.authkey = load_authkey()
+                conn = Client(self.address, authkey=self.authkey)
+            conn.send((op, payload))
+            reply = conn.recv()
+        except (OSError, EOFError):
+            if conn is not None:
+                conn.close()
+            raise
+        with self._lock:
+            self._idle.append(conn)
+        return reply
+
+    def run_batch(self, items):
+        return self._call("extract", list(items))
+
+    def ready(self):
+        """(ready, error) as seen by the host"""
+        return self._call("ready")
+
+    def version(self):
+        """result_version() of the host"""
+        return self._call("version")
+
+    def taxonomy(self):
+        return self._call("taxonomy")
+
+    def reload_taxonomy(self):
+        """Reload the host's configured SKILLS_PATH"""
+        return self._call("reload")
+
+    def stats(self):
+        return self._call("stats")
+
+    def metrics(self):
+        """Prometheus text of the host's own metrics (stage latencies)"""
+        return self._call("metrics")
+
+    def close(self):
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            conn.close()
+
+
+class ModelServer:
+    """Owns the models and serves extraction requests from many workers"""
+
+    def __init__(self, address, authkey=None, max_batch_size=16, max_wait_ms=10):
+        self.address = parse_address(address)
+        self.authkey = authkey or load_authkey(create=True)
+        self.scheduler = BatchScheduler(run_batch, max_batch_size=max_batch_size, max_wait_ms=max_wait_ms)
+        self.warm_up_error = None
+
+    def _warm_up(self):
+        try:
+            extractor.warm_up()
+        except Exception as e:
+            self.warm_up_error = repr(e)
+
+    def _handle(self, op, payload):
+        if op == "extract":
+            futures = self.scheduler.submit_many(payload)
+            return [future.result() for future in futures]
+        if op == "ready":
+            return extractor.is_ready(), self.warm_up_error
+        if op == "version":
+            return result_version()
+        if op == "taxonomy":
+            return taxonomy_info(extractor.get_taxonomy())
+        if op == "reload":
+            return taxonomy_info(extractor.reload_taxonomy())
+        if op == "stats":
+            return self.scheduler.stats()
+        if op == "metrics":
+            return metrics.REGISTRY.render()
+        raise ValueError(f"unknown operation {op!r}")
+
+    def _serve_connection(self, conn):
+        with conn:
+            while True:
+                try:
+                    op, payload = conn.recv()
+                except (EOFError, OSError):
+                    return
+                try:
+                    reply = ("ok", self._handle(op, payload))
+                except Exception as e:
+                    reply = ("error", repr(e))
+                conn.send(reply)
+
+    def _listen(self):
+        if not isinstance(self.address, str):
+            return Listener(self.address, authkey=self.authkey)
+        if os.path.exists(self.address):
+            os.unlink(self.address)   # stale socket from a previous run
+        # Create the socket owner-only; umask is process-wide, so this runs before any thread starts
+        old_umask = os.umask(0o177)
+        try:
+            return Listener(self.address, authkey=self.authkey)
+        finally:
+            os.umask(old_umask)
+
+    def serve_forever(self, poll=0):
+        listener = self._listen()
+        threading.Thread(target=self._warm_up, name="model-warm-up", daemon=True).start()
+        if poll > 0:
+            threading.Thread(
+                target=extractor.watch_taxonomy, args=(poll, threading.Event()), name="taxonomy-watch", daemon=True
+            ).start()
+        self.scheduler.start()
+        with listener:
+            while True:
+                try:
+                    conn = listener.accept()
+                except (OSError, EOFError, AuthenticationError):
+                    continue   # failed handshake (e.g. wrong key); keep serving others
+                threading.Thread(target=self._serve_connection, args=(conn,), daemon=True).start()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Host the extraction models for all API workers on this node")
+    parser.add_argument("--address", default=MODEL_SERVER or "/tmp/skillgap.sock",
+                        help="Unix socket path or host:port (default: $SKILLGAP_MODEL_SERVER)")
+    parser.add_argument("--max-batch-size", type=int, default=int(os.environ.get("SKILLGAP_MAX_BATCH_SIZE", "16")))
+    parser.add_argument("--max-wait-ms", type=float, default=float(os.environ.get("SKILLGAP_MAX_WAIT_MS", "10")))
+    parser.add_argument("--taxonomy-poll", type=float, default=float(os.environ.get("SKILLGAP_TAXONOMY_POLL", "0")),
+                        help="reload the taxonomy when its file changes, checking every N seconds")
+    args = parser.parse_args()
+
+    server = ModelServer(args.address, max_batch_size=args.max_batch_size, max_wait_ms=args.max_wait_ms)
+    print(f"Model server listening on {args.address}")
+    server.serve_forever(poll=args.taxonomy_poll)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+# ----------------------------------------------------------
+# SkillGapAI - Document text extraction
+# ----------------------------------------------------------
+# Importable (no Streamlit) so the apps, the API and batch tools share
+# one parser. PDFs are read page by page as a generator, with page and
+# character limits that stop reading early on very long documents.
+
+import io
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import docx2txt
+import PyPDF2
+
+from .text import clean_text
+
+MAX_PAGES = int(os.environ.get("SKILLGAP_MAX_PAGES", "100"))
+MAX_CHARS = int(os.environ.get("SKILLGAP_MAX_CHARS", "300000"))
+
+# PDFs with at least this many pages are split across a process pool when workers > 1
+PARALLEL_MIN_PAGES = 48
+PAGES_PER_TASK = 16
+
+
+class UnsupportedFormatError(ValueError):
+    pass
+
+
+def _read_bytes(source):
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "rb") as f:
+            return f.read()
+    if hasattr(source, "getvalue"):
+        return source.getvalue()
+    source.seek(0)
+    return source.read()
+
+
+def _extract_page_range(data, start, stop):
+    reader = PyPDF2.PdfReader(io.BytesIO(data))
+    return [reader.pages[i].extract_text() for i in range(start, stop)]
+
+
+def _iter_raw_pages(source, max_pages, workers):
+    reader = PyPDF2.PdfReader(source)
+    n_pages = len(reader.pages) if max_pages is None else min(len(reader.pages), max_pages)
+
+    if not workers or workers <= 1 or n_pages < PARALLEL_MIN_PAGES:
+        for i in range(n_pages):
+            yield reader.pages[i].extract_text()
+        return
+
+    data = _read_bytes(source)
+    ranges = [(start, min(start + PAGES_PER_TASK, n_pages)) for start in range(0, n_pages, PAGES_PER_TASK)]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(_extract_page_range, data, start, stop) for start, stop in ranges]
+        try:
+            for future in futures:
+                yield from future.result()
+        finally:
+            # Early stop: drop page ranges nobody will read
+            for future in futures:
+                future.cancel()
+
+
+def iter_pdf_text(source, max_pages=MAX_PAGES, max_chars=MAX_CHARS, workers=None):
+    """Yield cleaned text page by page, stopping at the page or character limit.
+
+    Joining the yielded pages with single spaces gives exactly
+    ``clean_text`` of the whole document (within the limits).
+    """
+    used = 0
+    for content in _iter_raw_pages(source, max_pages, workers):
+        page = clean_text(content) if content else ""
+        if not page:
+            continue
+        if used:
+            used += 1   # joining space
+        if max_chars is not None and used + len(page) >= max_chars:
+            page = page[:max_chars - used].rstrip()
+            if page:
+                yield page
+            return
+        used += len(page)
+        yield page
+
+
+def extract_text(source, name=None, max_pages=MAX_PAGES, max_chars=MAX_CHARS, workers=None):
+    """Extract cleaned plain text from a PDF, DOCX, or TXT path or file object"""
+    name = (name or getattr(source, "name", None) or str(source)).lower()
+
+    if name.endswith(".pdf"):
+        return " ".join(iter_pdf_text(source, max_pages, max_chars, workers))
+
+    if name.endswith(".docx"):
+        text = docx2txt.process(source)
+    elif name.endswith(".txt"):
+        text = _read_bytes(source).decode("utf-8")
+    else:
+        raise UnsupportedFormatError(f"Unsupported file format: {name}")
+
+    text = clean_text(text)
+    if max_chars is not None and len(text) > max_chars:
+        text = text[:max_chars].rstrip()
+    return text
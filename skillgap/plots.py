@@ -0,0 +1,88 @@
+import hashlib
+import io
+
+import numpy as np
+
+# Above this many cells annotations are skipped; above MAX_BINS per axis
+# rows/columns are reordered and pooled so render time stays flat
+ANNOTATE_MAX_CELLS = 200
+MAX_BINS = 60
+
+
+def matrix_hash(matrix, row_labels, col_labels):
+    """Stable key for a similarity matrix and its labels, for caching renders"""
+    h = hashlib.sha1(np.ascontiguousarray(matrix, dtype=np.float32).tobytes())
+    h.update("\0".join(row_labels).encode("utf-8"))
+    h.update(b"\1")
+    h.update("\0".join(col_labels).encode("utf-8"))
+    return h.hexdigest()
+
+
+def _seriate(matrix):
+    """Row/column order that groups each row with its best column (cheap clustering)"""
+    col_order = np.argsort(-matrix.max(axis=0), kind="stable")
+    rank = np.empty_like(col_order)
+    rank[col_order] = np.arange(len(col_order))
+    row_order = np.lexsort((-matrix.max(axis=1), rank[matrix.argmax(axis=1)]))
+    return row_order, col_order
+
+
+def _bins(n, max_bins):
+    return np.array_split(np.arange(n), min(n, max_bins))
+
+
+def _bin_label(labels, idx):
+    if len(idx) == 1:
+        return labels[idx[0]]
+    return f"{labels[idx[0]]} (+{len(idx) - 1})"
+
+
+def aggregate_matrix(matrix, row_labels, col_labels, max_bins=MAX_BINS):
+    """Reorder and max-pool a large matrix to at most max_bins x max_bins cells"""
+    matrix = np.asarray(matrix, dtype=np.float32)
+    if matrix.shape[0] <= max_bins and matrix.shape[1] <= max_bins:
+        return matrix, list(row_labels), list(col_labels)
+
+    row_order, col_order = _seriate(matrix)
+    matrix = matrix[row_order][:, col_order]
+    row_labels = [row_labels[i] for i in row_order]
+    col_labels = [col_labels[i] for i in col_order]
+
+    row_bins = _bins(matrix.shape[0], max_bins)
+    col_bins = _bins(matrix.shape[1], max_bins)
+    row_pooled = np.stack([matrix[idx].max(axis=0) for idx in row_bins])
+    pooled = np.stack([row_pooled[:, idx].max(axis=1) for idx in col_bins], axis=1)
+    return (
+        pooled,
+        [_bin_label(row_labels, idx) for idx in row_bins],
+        [_bin_label(col_labels, idx) for idx in col_bins],
+    )
+
+
+def similarity_heatmap_png(matrix, row_labels, col_labels, max_bins=MAX_BINS):
+    """Render the similarity heatmap to PNG bytes, pooling large matrices"""
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+
+    data, rows, cols = aggregate_matrix(matrix, row_labels, col_labels, max_bins)
+    annotate = data.size <= ANNOTATE_MAX_CELLS
+    large = data.shape != np.shape(matrix)
+
+    fig, ax = plt.subplots(figsize=(12, 8) if large else (12, 4))
+    sns.heatmap(
+        data,
+        annot=annotate,
+        cmap="Blues",
+        fmt=".2f",
+        xticklabels=cols,
+        yticklabels=rows,
+        ax=ax
+    )
+    if large:
+        ax.set_title(f"{len(row_labels)} x {len(col_labels)} skills, max-pooled to {data.shape[0]} x {data.shape[1]}")
+        ax.tick_params(labelsize=6)
+
+    buf = io.BytesIO()
+    fig.savefig(buf, format="png", bbox_inches="tight")
+    plt.close(fig)
+    return buf.getvalue()
@@ -0,0 +1,133 @@
+# ----------------------------------------------------------
+# SkillGapAI - PDF skill-gap reports
+# ----------------------------------------------------------
+# One report per candidate/JD pair. Batch mode renders many reports in a
+# process pool and writes one PDF per pair or a single zip archive:
+#
+#   python -m skillgap.report pairs.jsonl --out reports/
+#   python -m skillgap.report pairs.jsonl --zip reports.zip --workers 8
+#
+# Each input line is a JSON object:
+#   {"id": "...", "overall_match": 72, "matched": 6, "missing": 4,
+#    "skills": [{"skill": "Python", "resume": 92, "job": 95}, ...]}
+
+import argparse
+import json
+import os
+import re
+import sys
+import time
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+
+
+def generate_pdf(overall_match, matched, missing, skills):
+    """PDF bytes for one report; skills is a sequence of (skill, resume score, job score)"""
+    from fpdf import FPDF
+
+    pdf = FPDF()
+    pdf.add_page()
+    pdf.set_font("Arial", size=12)
+
+    pdf.cell(200, 10, txt="SkillGapAI - Skill Gap Report", ln=True, align='C')
+    pdf.ln(10)
+
+    pdf.cell(200, 10, txt=f"Overall Match: {overall_match}%", ln=True)
+    pdf.cell(200, 10, txt=f"Matched Skills: {matched}", ln=True)
+    pdf.cell(200, 10, txt=f"Missing Skills: {missing}", ln=True)
+
+    pdf.ln(10)
+    pdf.cell(200, 10, txt="Skill Comparison:", ln=True)
+
+    for skill, resume_score, job_score in skills:
+        pdf.cell(200, 10, txt=f"{skill} - Resume: {resume_score}%, Job: {job_score}%", ln=True)
+
+    return pdf.output(dest='S').encode('latin1')
+
+
+def _render(item):
+    """(id, PDF bytes, error) for one numbered pair; a bad pair is an error, never an exception"""
+    number, pair = item
+    report_id = f"line-{number}"
+    try:
+        if isinstance(pair, str):
+            if not pair.strip():
+                return None, None, None
+            pair = json.loads(pair)
+        report_id = pair.get("id", report_id)
+        skills = [(s["skill"], s["resume"], s["job"]) for s in pair.get("skills", [])]
+        return report_id, generate_pdf(pair["overall_match"], pair["matched"], pair["missing"], skills), None
+    except Exception as e:
+        return report_id, None, f"{type(e).__name__}: {e}"
+
+
+def _file_name(report_id):
+    return re.sub(r"[^\w.-]+", "_", str(report_id)) + ".pdf"
+
+
+def render_reports(pairs, out_dir=None, zip_path=None, workers=None, chunksize=16):
+    """Render reports in a process pool; the main process only writes files.
+
+    pairs yields dicts or JSON strings; one without an "id" is named after
+    its 1-based position (its line in a JSONL file read by _read_pairs).
+    """
+    if (out_dir is None) == (zip_path is None):
+        raise ValueError("Pass exactly one of out_dir or zip_path")
+
+    archive = zipfile.ZipFile(zip_path, "w", zipfile.ZIP_STORED) if zip_path else None
+    if out_dir:
+        os.makedirs(out_dir, exist_ok=True)
+
+    written, errors = 0, []
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for report_id, data, error in pool.map(_render, enumerate(pairs, 1), chunksize=chunksize):
+                if report_id is None:
+                    continue   # blank line
+                if error:
+                    errors.append({"id": report_id, "error": error})
+                    continue
+                if archive:
+                    archive.writestr(_file_name(report_id), data)
+                else:
+                    with open(os.path.join(out_dir, _file_name(report_id)), "wb") as f:
+                        f.write(data)
+                written += 1
+    finally:
+        if archive:
+            archive.close()
+    return written, errors
+
+
+def _read_pairs(path):
+    """Raw lines, parsed in the workers so one malformed line only fails its own report"""
+    with open(path, "r", encoding="utf-8") as f:
+        yield from f
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Render skill-gap PDF reports in bulk")
+    parser.add_argument("pairs", help="JSONL file, one candidate/JD pair per line")
+    parser.add_argument("--out", help="directory for one PDF per pair")
+    parser.add_argument("--zip", help="write all PDFs into this zip archive instead")
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    if (args.out is None) == (args.zip is None):
+        parser.error("pass exactly one of --out or --zip")
+
+    start = time.perf_counter()
+    written, errors = render_reports(_read_pairs(args.pairs), args.out, args.zip, args.workers)
+    elapsed = time.perf_counter() - start
+    for error in errors:
+        print(json.dumps(error), file=sys.stderr)
+    print(json.dumps({
+        "reports": written,
+        "errors": len(errors),
+        "seconds": round(elapsed, 3),
+        "reports_per_second": round(written / elapsed, 2) if elapsed else 0.0,
+    }), file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
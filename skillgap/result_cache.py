@@ -0,0 +1,173 @@
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+from .text import clean_text
+
+
+def cache_key(text, version):
+    """Content address for a document: hash of the normalized text plus skill-DB version"""
+    normalized = clean_text(text)
+    return hashlib.sha256(f"{version}\0{normalized}".encode("utf-8")).hexdigest()
+
+
+class _MemoryStore:
+    def __init__(self):
+        self._entries = OrderedDict()
+
+    def get(self, key):
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def set(self, key, stored_at, value):
+        self._entries[key] = (stored_at, value)
+        self._entries.move_to_end(key)
+
+    def delete(self, key):
+        self._entries.pop(key, None)
+
+    def evict(self, max_entries):
+        evicted = 0
+        while len(self._entries) > max_entries:
+            self._entries.popitem(last=False)
+            evicted += 1
+        return evicted
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class _SqliteStore:
+    # Recency updates from hits are buffered and written in one transaction,
+    # so a read does not cost a commit
+    TOUCH_BATCH = 256
+    # The entry count is kept in memory; recount now and then in case other
+    # processes share the file
+    RECOUNT_EVERY = 1024
+
+    def __init__(self, path):
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._touched = {}
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS results ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, stored_at REAL NOT NULL, used_at REAL NOT NULL)"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS results_used_at ON results (used_at)")
+        self._db.commit()
+        self._recount()
+
+    def _recount(self):
+        self._count = self._db.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+        self._sets = 0
+
+    def get(self, key):
+        row = self._db.execute("SELECT stored_at, value FROM results WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        self._touched[key] = time.time()
+        if len(self._touched) >= self.TOUCH_BATCH:
+            self._flush_touched()
+            self._db.commit()
+        return row[0], json.loads(row[1])
+
+    def _flush_touched(self):
+        if self._touched:
+            self._db.executemany(
+                "UPDATE results SET used_at = ? WHERE key = ?", [(t, k) for k, t in self._touched.items()]
+            )
+            self._touched = {}
+
+    def set(self, key, stored_at, value):
+        self._touched.pop(key, None)
+        exists = self._db.execute("SELECT 1 FROM results WHERE key = ?", (key,)).fetchone()
+        self._db.execute(
+            "INSERT OR REPLACE INTO results (key, value, stored_at, used_at) VALUES (?, ?, ?, ?)",
+            (key, json.dumps(value), stored_at, time.time()),
+        )
+        self._db.commit()
+        self._count += exists is None
+        self._sets += 1
+        if self._sets >= self.RECOUNT_EVERY:
+            self._recount()
+
+    def delete(self, key):
+        self._touched.pop(key, None)
+        self._count -= self._db.execute("DELETE FROM results WHERE key = ?", (key,)).rowcount
+        self._db.commit()
+
+    def evict(self, max_entries):
+        excess = len(self) - max_entries
+        if excess <= 0:
+            return 0
+        self._flush_touched()   # evict by up-to-date recency
+        evicted = self._db.execute(
+            "DELETE FROM results WHERE key IN (SELECT key FROM results ORDER BY used_at LIMIT ?)",
+            (excess,),
+        ).rowcount
+        self._db.commit()
+        self._count -= evicted
+        return evicted
+
+    def __len__(self):
+        return self._count
+
+
+class ResultCache:
+    """Bounded LRU cache of extraction results keyed by document content.
+
+    Entries live in memory by default; pass ``path`` to keep them in a
+    local SQLite file so they survive restarts. ``ttl`` (seconds) expires
+    entries regardless of use.
+    """
+
+    def __init__(self, max_entries=1024, ttl=None, path=None):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._store = _SqliteStore(path) if path else _MemoryStore()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key):
+        with self._lock:
+            entry = self._store.get(key)
+            if entry is not None and self.ttl is not None and time.time() - entry[0] > self.ttl:
+                self._store.delete(key)
+                self.expirations += 1
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            return entry[1]
+
+    def get_many(self, keys):
+        return [self.get(key) for key in keys]
+
+    def set(self, key, value):
+        with self._lock:
+            self._store.set(key, time.time(), value)
+            self.evictions += self._store.evict(self.max_entries)
+
+    def set_many(self, items):
+        for key, value in items:
+            self.set(key, value)
+
+    def stats(self):
+        with self._lock:
+            return {
+                "entries": len(self._store),
+                "max_entries": self.max_entries,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+            }
@@ -0,0 +1,99 @@
+import numpy as np
+
+MATCH_THRESHOLD = 0.75
+PARTIAL_THRESHOLD = 0.4
+
+
+def normalize_rows(embeddings):
+    """L2-normalize each row so dot products are cosine similarities"""
+    embeddings = np.asarray(embeddings, dtype=np.float32)
+    if embeddings.ndim == 1:
+        embeddings = embeddings[None, :]
+    norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+    return embeddings / np.maximum(norms, 1e-12)
+
+
+def cosine_matrix(a, b):
+    """Full cosine-similarity matrix; only for matrices small enough to display"""
+    return normalize_rows(a) @ normalize_rows(b).T
+
+
+def top_k_similar(queries, candidates, k=1, block_size=2048, normalized=False):
+    """Top-k candidate rows for every query row using blocked matmuls.
+
+    Returns ``(scores, indices)``, both shaped ``(len(queries), k)`` and
+    sorted best first. At most ``block_size x block_size`` scores are held
+    in memory at once, so large vocabularies stay bounded.
+    """
+    if not normalized:
+        queries, candidates = normalize_rows(queries), normalize_rows(candidates)
+    n_queries, n_candidates = len(queries), len(candidates)
+    k = min(k, n_candidates)
+
+    top_scores = np.full((n_queries, k), -np.inf, dtype=np.float32)
+    top_indices = np.full((n_queries, k), -1, dtype=np.int64)
+    if k == 0:
+        return top_scores, top_indices
+
+    for q0 in range(0, n_queries, block_size):
+        q_block = queries[q0:q0 + block_size]
+        best_s = top_scores[q0:q0 + block_size]
+        best_i = top_indices[q0:q0 + block_size]
+
+        for c0 in range(0, n_candidates, block_size):
+            scores = q_block @ candidates[c0:c0 + block_size].T
+            ids = np.broadcast_to(np.arange(c0, c0 + scores.shape[1]), scores.shape)
+
+            # Merge the running top-k with this block and keep the best k
+            cand_s = np.concatenate([best_s, scores], axis=1)
+            cand_i = np.concatenate([best_i, ids], axis=1)
+            keep = np.argpartition(-cand_s, k - 1, axis=1)[:, :k]
+            best_s = np.take_along_axis(cand_s, keep, axis=1)
+            best_i = np.take_along_axis(cand_i, keep, axis=1)
+
+        order = np.argsort(-best_s, axis=1)
+        top_scores[q0:q0 + block_size] = np.take_along_axis(best_s, order, axis=1)
+        top_indices[q0:q0 + block_size] = np.take_along_axis(best_i, order, axis=1)
+
+    return top_scores, top_indices
+
+
+def match_skills(resume_skills, job_skills, resume_embeddings, job_embeddings,
+                 match_threshold=MATCH_THRESHOLD, partial_threshold=PARTIAL_THRESHOLD,
+                 top_k=1, block_size=2048):
+    """Classify every JD skill as matched, partial or missing against the resume.
+
+    For each JD skill the result holds its best similarity score, the
+    best-matching resume skill and the top-k resume candidates.
+    """
+    n_jobs = len(job_skills)
+    if len(resume_skills) and n_jobs:
+        top_scores, top_indices = top_k_similar(
+            job_embeddings, resume_embeddings, k=top_k, block_size=block_size
+        )
+        best_score = top_scores[:, 0]
+        best_index = top_indices[:, 0]
+    else:
+        top_scores = np.zeros((n_jobs, 0), dtype=np.float32)
+        top_indices = np.zeros((n_jobs, 0), dtype=np.int64)
+        best_score = np.zeros(n_jobs, dtype=np.float32)
+        best_index = np.full(n_jobs, -1, dtype=np.int64)
+
+    status = np.select(
+        [best_score >= match_threshold, best_score >= partial_threshold],
+        ["matched", "partial"],
+        default="missing",
+    )
+    job_array = np.asarray(job_skills, dtype=object)
+
+    return {
+        "best_score": best_score,
+        "best_index": best_index,
+        "best_match": [resume_skills[i] if i >= 0 else None for i in best_index],
+        "top_scores": top_scores,
+        "top_indices": top_indices,
+        "status": status,
+        "matched": job_array[status == "matched"].tolist(),
+        "partial": job_array[status == "partial"].tolist(),
+        "missing": job_array[status == "missing"].tolist(),
+    }
@@ -0,0 +1,106 @@
+# ----------------------------------------------------------
+# SkillGapAI - Skill taxonomy with aliases and compiled index
+# ----------------------------------------------------------
+# skills.json lists skills per category; an entry is either a plain name
+# or an object with aliases:
+#
+#   {
+#     "version": "2026.10",
+#     "categories": {
+#       "technical": ["python", {"name": "kubernetes", "aliases": ["k8s"]}],
+#       "soft": ["communication"]
+#     }
+#   }
+#
+# The older {"technical": [...], "soft": [...]} layout is still accepted.
+# Compile once into a binary index (matcher automaton, alias table and
+# taxonomy) that loads with mmap in milliseconds:
+#
+#   python -m skillgap.taxonomy skills.json skills.idx
+
+import argparse
+import hashlib
+import json
+import threading
+
+from .matcher import SkillMatcher
+
+
+class Taxonomy:
+    """Immutable snapshot of a skill taxonomy and its compiled matcher.
+
+    Hot reload swaps whole snapshots, so a request that already holds one
+    keeps a consistent view until it finishes.
+    """
+
+    def __init__(self, skill_db, aliases=None, version=None, matcher=None, digest=None):
+        self.skill_db = {category: list(skills) for category, skills in skill_db.items()}
+        self.aliases = dict(aliases or {})
+        if digest is None:
+            content = json.dumps([self.skill_db, self.aliases], sort_keys=True).encode("utf-8")
+            digest = hashlib.sha256(content).hexdigest()[:16]
+        self.declared_version = version
+        self.digest = digest
+        self.version = f"{version}+{digest}" if version else digest
+        self.matcher = matcher or SkillMatcher(self.skill_db, self.aliases)
+        self.labels = [skill for skills in self.skill_db.values() for skill in skills]
+        # Per-snapshot derived data (e.g. label embeddings), filled by its users
+        self.cache = {}
+        self.cache_lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.labels)
+
+    def save(self, path):
+        """Write the compiled index: automaton arrays plus this taxonomy as metadata"""
+        self.matcher.save(path, {
+            "skill_db": self.skill_db,
+            "aliases": self.aliases,
+            "version": self.declared_version,
+            "digest": self.digest,
+        })
+
+    @classmethod
+    def from_json(cls, data):
+        if not isinstance(data, dict) or not isinstance(data.get("categories", {}), dict):
+            raise ValueError("Taxonomy JSON must be an object of categories")
+        if "categories" not in data:
+            return cls(data)
+        skill_db, aliases = {}, {}
+        for category, entries in data["categories"].items():
+            names = skill_db.setdefault(category, [])
+            for entry in entries:
+                if isinstance(entry, str):
+                    names.append(entry)
+                else:
+                    names.append(entry["name"])
+                    for alias in entry.get("aliases", []):
+                        aliases[alias] = entry["name"]
+        return cls(skill_db, aliases, data.get("version"))
+
+
+def load_taxonomy(path):
+    """Load a taxonomy from skills.json or from a compiled index"""
+    with open(path, "rb") as f:
+        compiled = f.read(8) == b"SGMATCH1"
+    if compiled:
+        matcher, meta = SkillMatcher.load(path)
+        return Taxonomy(meta["skill_db"], meta["aliases"], meta["version"], matcher=matcher, digest=meta["digest"])
+    with open(path, "r", encoding="utf-8") as f:
+        return Taxonomy.from_json(json.load(f))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compile skills.json into a binary skill index")
+    parser.add_argument("source", help="skills.json")
+    parser.add_argument("out", help="compiled index path, e.g. skills.idx")
+    args = parser.parse_args()
+
+    taxonomy = load_taxonomy(args.source)
+    taxonomy.save(args.out)
+    print(f"Compiled {len(taxonomy)} skills and {len(taxonomy.aliases)} aliases "
+          f"(version {taxonomy.version}) into {args.out}")
+
+
+if __name__ == "__main__":
+    main()
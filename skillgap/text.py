@@ -0,0 +1,42 @@
+import re
+
+
+def clean_text(text):
+    """Normalize text by removing extra spaces and line breaks"""
+    text = re.sub(r'\s+', ' ', text)
+    text = text.replace('\r', '').replace('\n', ' ')
+    return text.strip()
+
+
+def normalize_skill(skill):
+    """Canonical form of a skill string used as a lookup key"""
+    return clean_text(skill).lower()
+
+
+def split_windows(text, max_chars):
+    """Split text into windows of at most max_chars, on paragraph then sentence boundaries"""
+    pieces = []
+    for paragraph in re.split(r'\n\s*\n', text):
+        paragraph = clean_text(paragraph)
+        if len(paragraph) <= max_chars:
+            pieces.append(paragraph)
+            continue
+        for sentence in re.split(r'(?<=[.!?;])\s+', paragraph):
+            # A run-on "sentence" (e.g. a long skills list) is cut at word boundaries
+            while len(sentence) > max_chars:
+                cut = sentence.rfind(' ', 0, max_chars + 1)
+                cut = cut if cut > 0 else max_chars
+                pieces.append(sentence[:cut])
+                sentence = sentence[cut:].lstrip()
+            pieces.append(sentence)
+
+    # Pack neighbouring paragraphs/sentences together up to max_chars
+    windows = []
+    for piece in pieces:
+        if not piece:
+            continue
+        if windows and len(windows[-1]) + 1 + len(piece) <= max_chars:
+            windows[-1] += " " + piece
+        else:
+            windows.append(piece)
+    return windows
@@ -0,0 +1,100 @@
+# ----------------------------------------------------------
+# SkillGapAI - Zero-shot classifier backends
+# ----------------------------------------------------------
+# The zero-shot model (BART-large-MNLI) is the most expensive stage on
+# CPU. Besides the default full-precision pipeline there are two cheaper
+# backends, both loaded from a local model directory:
+#
+#   torch  full-precision transformers pipeline (default)
+#   int8   same weights with dynamic int8 quantization of the Linear layers
+#   onnx   exported ONNX graph run by ONNX Runtime (int8-quantized by default)
+#
+# Prepare a directory once, then point the extractor at it:
+#
+#   python -m skillgap.zero_shot --backend onnx --out models/bart-onnx
+#   SKILLGAP_ZERO_SHOT_BACKEND=onnx SKILLGAP_ZERO_SHOT_MODEL_DIR=models/bart-onnx uvicorn app:app
+#
+# Check accuracy and speed against fp32 with benchmarks/zero_shot.py.
+
+import argparse
+import os
+
+BACKENDS = ("torch", "int8", "onnx")
+DEFAULT_MODEL = "facebook/bart-large-mnli"
+QUANTIZED_ONNX = "model_quantized.onnx"
+
+
+def _load_torch(source):
+    from transformers import pipeline
+    return pipeline("zero-shot-classification", model=source)
+
+
+def _load_int8(source):
+    import torch
+    from transformers import AutoModelForSequenceClassification, AutoTokenizer, pipeline
+
+    model = AutoModelForSequenceClassification.from_pretrained(source)
+    model = torch.ao.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+    tokenizer = AutoTokenizer.from_pretrained(source)
+    return pipeline("zero-shot-classification", model=model, tokenizer=tokenizer, device=-1)
+
+
+def _load_onnx(source):
+    from optimum.onnxruntime import ORTModelForSequenceClassification
+    from transformers import AutoTokenizer, pipeline
+
+    kwargs = {}
+    if os.path.exists(os.path.join(source, QUANTIZED_ONNX)):
+        kwargs["file_name"] = QUANTIZED_ONNX
+    model = ORTModelForSequenceClassification.from_pretrained(source, **kwargs)
+    tokenizer = AutoTokenizer.from_pretrained(source)
+    return pipeline("zero-shot-classification", model=model, tokenizer=tokenizer)
+
+
+_LOADERS = {"torch": _load_torch, "int8": _load_int8, "onnx": _load_onnx}
+
+
+def load_classifier(backend="torch", model_dir=None, model=DEFAULT_MODEL):
+    """Zero-shot classification pipeline for backend, from model_dir if given"""
+    if backend not in _LOADERS:
+        raise ValueError(f"Unknown zero-shot backend {backend!r}; expected one of {', '.join(BACKENDS)}")
+    if backend == "onnx" and not model_dir:
+        raise ValueError("The onnx backend needs a model directory; create one with `python -m skillgap.zero_shot`")
+    return _LOADERS[backend](model_dir or model)
+
+
+def export(out_dir, backend, model=DEFAULT_MODEL, quantize=True):
+    """Write a local model directory that load_classifier(backend, out_dir) can use"""
+    from transformers import AutoTokenizer
+
+    os.makedirs(out_dir, exist_ok=True)
+    AutoTokenizer.from_pretrained(model).save_pretrained(out_dir)
+
+    if backend == "onnx":
+        from optimum.onnxruntime import ORTModelForSequenceClassification, ORTQuantizer
+        from optimum.onnxruntime.configuration import AutoQuantizationConfig
+
+        ORTModelForSequenceClassification.from_pretrained(model, export=True).save_pretrained(out_dir)
+        if quantize:
+            config = AutoQuantizationConfig.avx2(is_static=False, per_channel=False)
+            ORTQuantizer.from_pretrained(out_dir).quantize(save_dir=out_dir, quantization_config=config)
+    else:
+        # int8 quantizes at load time (it takes seconds), so the fp32 weights are stored
+        from transformers import AutoModelForSequenceClassification
+        AutoModelForSequenceClassification.from_pretrained(model).save_pretrained(out_dir)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Prepare a local model directory for a zero-shot backend")
+    parser.add_argument("--backend", choices=BACKENDS, default="onnx")
+    parser.add_argument("--model", default=DEFAULT_MODEL)
+    parser.add_argument("--out", required=True, help="output model directory")
+    parser.add_argument("--no-quantize", action="store_true", help="keep the ONNX graph in fp32")
+    args = parser.parse_args()
+
+    export(args.out, args.backend, model=args.model, quantize=not args.no_quantize)
+    print(f"Wrote {args.backend} model directory to {args.out}")
+
+
+if __name__ == "__main__":
+    main()